@@ -8,6 +8,7 @@ from typing import (
 	Set, Dict, List, 
 	Tuple, Callable, Union
 )
+from functools import lru_cache
 
 from pattern.en import SG, PL
 from pattern.en import PAST, PRESENT, INFINITIVE
@@ -18,6 +19,11 @@ MIN_SENTENCE_LENGTH_IN_CHARS: int = 2
 MAX_SENTENCE_LENGTH_IN_WORDS: int = 50
 MIN_SENTENCE_LENGTH_IN_WORDS: int = 3
 
+# a generous upper bound on the length of a sentence
+# with at most MAX_SENTENCE_LENGTH_IN_WORDS words,
+# so that we can reject long lines without splitting them
+MAX_SENTENCE_LENGTH_IN_CHARS: int = MAX_SENTENCE_LENGTH_IN_WORDS * 30
+
 SPACE_CHARS: Set[str] = {
 	chr(8202),
 	chr(8198),
@@ -111,12 +117,37 @@ SUBJ_DEPS: Set[str] = {
 	"expl",
 }
 
+CLAUSAL_SUBJ_DEPS: Set[str] = {
+	"csubj",
+	"csubjpass",
+}
+
 OBJ_DEPS: Set[str] = {
 	"cobj", 
 	"nobj",
 	"dobj",
 }
 
+# the subject of a hyphenated verb (co-...) can
+# end up as a compound
+SUBJ_OR_COMPOUND_DEPS: Set[str] = SUBJ_DEPS.union({'compound'})
+
+AUX_DEPS: Set[str] = {
+	"aux",
+	"auxpass",
+}
+
+DET_DEPS: Set[str] = {
+	"det",
+	"nummod",
+}
+
+# nouns with these deps are part of a larger noun
+COMPOUND_DEPS: Set[str] = {
+	"compound",
+	"nmod",
+}
+
 DET_TAGS: Set[str] = {
 	'DT',
 	'JJ', # many,
@@ -130,6 +161,27 @@ NOUN_POS_TAGS: Set[str] = {
 	'PROPN',
 }
 
+# as above, but without pronouns
+LEXICAL_NOUN_POS_TAGS: Set[str] = {
+	'NOUN',
+	'PROPN',
+}
+
+# participles can't be reinflected
+PARTICIPLE_TAGS: Set[str] = {
+	'VBN',
+	'VBG',
+}
+
+# verb tags that a clausal subject can have
+# without being headed by "that" or "to"
+NON_COMPLEMENTIZER_CLAUSE_TAGS: Set[str] = {
+	'VBG',
+	'VBN',
+	'VB',
+	'VBZ',
+}
+
 # mostly wh-words
 SUBJ_EXCL_TAGS: Set[str] = {
 	'WP',
@@ -137,6 +189,28 @@ SUBJ_EXCL_TAGS: Set[str] = {
 	'WDT',
 }
 
+# sentences ending with these can be
+# turned into questions
+DECLARATIVE_FINAL_PUNCT: Set[str] = {
+	'.',
+	'!',
+}
+
+# forms of "use" in "used to", which
+# can't be made present tense
+USE_TO_FORMS: Set[str] = {
+	'use',
+	'used',
+}
+
+# used as plural subjects of copular sentences
+SOME_ANY: Set[str] = {
+	'Some',
+	'some',
+	'Any',
+	'any',
+}
+
 NUMBER_MAP: Dict[str,str] = {
 	'Singular': SG,
 	'singular': SG,
@@ -186,6 +260,42 @@ PLURALIZE_MAP: Dict[str,str] = {
 	'the': 'the', # pattern.en does 'thes' lol
 }
 
+# determiners that agree in number with their noun,
+# and their form for each number
+DETERMINER_RENUMBER_MAP: Dict[str,Dict[str,str]] = {
+	SG: {
+		'these': 'this',
+		'those': 'that',
+	},
+	PL: {
+		'this': 'these',
+		'that': 'those',
+	},
+}
+
+# determiners that have no form for the other number.
+# nouns with these can't be renumbered without
+# rewriting the whole noun phrase
+DETERMINERS_WITHOUT_NUMBER_FORM: Dict[str,Set[str]] = {
+	SG: {
+		'many',
+		'several',
+		'few',
+		'both',
+		'all',
+		'most',
+		'various',
+		'numerous',
+	},
+	PL: {
+		'a',
+		'an',
+		'every',
+		'each',
+		'another',
+	},
+}
+
 # things that pattern.en gets wrong.
 # also, we don't force US English here, but in cases
 # where a form is ambiguous, we prefer it
@@ -2788,6 +2898,11 @@ PARTITIVES_WITH_INDEFINITE_ONLY: Set[str] = {
 	'array',
 }
 
+PARTITIVES_WITH_OR_OPTIONAL_P: Set[str] = {
+	*PARTITIVES_WITH_P,
+	*PARTITIVES_OPTIONAL_P,
+}
+
 ALL_PARTITIVES: Set[str] = {
 	*PARTITIVES_WITH_P,
 	*PARTITIVES_OPTIONAL_P,
@@ -2858,6 +2973,7 @@ VERB_PREFIXES: Set[str] = {
 	'co',
 }
 
+@lru_cache(maxsize=8192)
 def word_is_number(s: str) -> bool:
 	'''
 	Returns true if the word can be
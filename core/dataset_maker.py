@@ -18,19 +18,23 @@ from tqdm import tqdm
 from tqdm.contrib.logging import logging_redirect_tqdm
 from typing import List, Callable, Tuple, Dict, Set, Union
 from datasets import load_dataset, Dataset
+from itertools import count
 from collections import defaultdict, Counter
 from collections.abc import Hashable
 
 from .timeout import timeout
 from .constants import SPACE_CHARS
-from .spacyutils import nlp, EDoc
+from .spacyutils import nlp, nlp_batch, EDoc
+from .language_funs.en.grammar_funs import en_string_conditions
 
 logging.basicConfig(encoding='utf-8', level=logging.INFO)
 log = logging.getLogger(__name__)
 
+# we only need the sentencizer here, so we exclude
+# everything else instead of loading it and disabling it
 split_sentences = spacy.load(
 	'en_core_web_trf', 
-	disable=['transformer', 'tagger', 'parser', 'attribute_ruler', 'lemmatizer', 'ner']
+	exclude=['transformer', 'tagger', 'parser', 'attribute_ruler', 'lemmatizer', 'ner']
 )
 split_sentences.add_pipe('sentencizer')
 
@@ -104,6 +108,8 @@ def create_seq2seq_dataset(
 	metadata_fun: Callable = None,
 	metadata_fun_args: Tuple = None,
 	metadata_fun_kwargs: Dict = None,
+	parse_batch_size: int = None,
+	string_conditions_fun: Callable = None,
 	# dump_freq: int = DUMP_FREQ,
 ) -> None:
 	'''
@@ -130,13 +136,15 @@ def create_seq2seq_dataset(
 										  sentence (parsed with core_en_web_trf)
 			splits_funs_args (dict)		: mapping between split names and additional args to for splits_funs[split]
 			splits_funs_kwargs (dict)	: additional arguments to pass to the function used on each example
+			parse_batch_size (int)		: passed to generate_random_examples
+			string_conditions_fun (callable): passed to generate_random_examples
 							
 	'''
 	name 				= name if name is not None else dataset
 	dataset_args 		= () if not dataset_args else dataset_args
 	dataset_kwargs 		= {} if not dataset_kwargs else dataset_kwargs
 	
-	conditions_fun 		= (lambda s, *args, **kwargs: nlp(s)) if conditions_fun is None else conditions_fun
+	conditions_fun 		= (lambda s, *args, **kwargs: s if isinstance(s, EDoc) else nlp(s)) if conditions_fun is None else conditions_fun
 	conditions_fun_args = () if not conditions_fun_args else conditions_fun_args
 	conditions_fun_kwargs = {} if not conditions_fun_kwargs else conditions_fun_kwargs
 	
@@ -173,31 +181,43 @@ def create_seq2seq_dataset(
 			ex_generator = generate_random_examples(
 								dataset=dataset[data_split],
 								data_field=data_field,
-								n=n,
+								n=None,
 								conditions_fun=conditions_fun,
 								conditions_fun_args=conditions_fun_args,
 								conditions_fun_kwargs=conditions_fun_kwargs,
+								parse_batch_size=parse_batch_size,
+								string_conditions_fun=string_conditions_fun,
 							)
 			
-			for i, ex in tqdm(enumerate(ex_generator), postfix=f'{split=}', total=n):
-				try:
-					# get the metadata first so that we don't set 
-					# the dataset[i] to the bad example
-					# if the error arises in the metadata function.
-					# this way the exception will be raised BEFORE
-					# changing anything
-					pair = splits_funs[split](ex, *splits_funs_args[split], **splits_funs_kwargs[split])
-					metadata = metadata_fun(pair, *metadata_fun_args, **metadata_fun_kwargs)
-					new_dataset[i] = {'translation': {k: str(v) for k, v in pair.items()}}
-					new_metadata[i] = metadata
-				except KeyboardInterrupt:
-					sys.exit(f'User terminated program on example "{ex}".')
-				except Exception as e:
-					log.warning(f'Example "{ex}" ran into an error!:\n\n')
-					log.warning(traceback.format_exc())
-					log.warning('\n\n')
-					ex = ''
-					pass
+			# examples that run into an error are skipped,
+			# and we draw another one in their place, so
+			# that every slot gets filled
+			i = 0
+			with tqdm(postfix=f'{split=}', total=n) as progress:
+				while i < n:
+					ex = next(ex_generator)
+					try:
+						# get the metadata first so that we don't set 
+						# the dataset[i] to the bad example
+						# if the error arises in the metadata function.
+						# this way the exception will be raised BEFORE
+						# changing anything
+						pair = splits_funs[split](ex, *splits_funs_args[split], **splits_funs_kwargs[split])
+						metadata = metadata_fun(pair, *metadata_fun_args, **metadata_fun_kwargs)
+						new_dataset[i] = {'translation': {k: str(v) for k, v in pair.items()}}
+						new_metadata[i] = metadata
+					except KeyboardInterrupt:
+						sys.exit(f'User terminated program on example "{ex}".')
+					except Exception as e:
+						log.warning(f'Example "{ex}" ran into an error!:\n\n')
+						log.warning(traceback.format_exc())
+						log.warning('\n\n')
+						continue
+					
+					i += 1
+					progress.update()
+			
+			ex_generator.close()
 		
 		if any(new_dataset):
 			os.makedirs(os.path.join('data', name), exist_ok=True)
@@ -295,63 +315,115 @@ def generate_random_examples(
 	conditions_fun: Callable = None,
 	conditions_fun_args: Tuple = None,
 	conditions_fun_kwargs: Dict = None,
+	split_batch_size: int = 64,
+	parse_batch_size: int = None,
+	string_conditions_fun: Callable = None,
 ) -> Union[EDoc,str]:
 	'''
 	Generates a random example from the dataset.
 	
 		params:
 			dataset (Dataset)			: a Dataset to draw a random example from
+			n (int)						: how many examples to generate. if None, examples
+										  are generated until the generator is closed
+			split_batch_size (int)		: how many random examples/pages to split into
+										  sentences at once
 			conditions_fun (Callable)	: a function to apply to a sentence that can filter
 										  out unwanted examples. in case the sentence
 										  passes all checks, it should return the parsed sentence
 										  as an EDoc, else False
 			conditions_fun_args (Tuple)	: passed to conditions_fun
 			conditions_fun_kwargs (Dict): passed to conditions_fun
+			parse_batch_size (int)		: if set, draw this many sentences at once and
+										  parse them together with nlp_batch, which is much
+										  faster than parsing them one at a time. conditions_fun
+										  is then passed EDocs instead of strings, so it must
+										  accept them (as basic_conditions does). sentences left
+										  over at the end are parsed but never used
+			string_conditions_fun (Callable): when parsing in batches, sentences are only
+										  parsed if they pass this cheap check on the string,
+										  so that junk is never sent to the parser.
+										  defaults to en_string_conditions, which all
+										  of the EN conditions functions start with
 		
 		returns:
 			EDoc, str					: a random sentence pulled from the dataset, parsed or not
 	'''
 	conditions_fun_args = () if conditions_fun_args is None else conditions_fun_args
 	conditions_fun_kwargs = {} if conditions_fun_kwargs is None else conditions_fun_kwargs
+	string_conditions_fun = en_string_conditions if string_conditions_fun is None else string_conditions_fun
 	
-	skipped = 0
-	for _ in range(n):
-		e = ''
-		nrows = len(dataset)-1
-		while not e:
-			# pick a random example/page
-			r  = int(random.random() * nrows)
-			ex = dataset[r][data_field]
-			
-			# adding the strip here because spaCy can't deal with leading spaces or trailing spaces well
-			ex = [str(s).strip() for s in split_sentences(dataset[r][data_field]).sents]
-			
-			# get a random sentence first and then check
-			# because most sentences will meet our criteria
-			# this way we don't parse all of them. 
-			# this should speed things up considerably
-			r2 = int(random.random() * (len(ex)-1))
-			s  = ex[r2]
-			
-			# replace special space characters
-			for c in SPACE_CHARS:
-				s = s.replace(c, ' ')
-			
-			# spaCy doesn't handle extra spaces well
-			while '  ' in s:
-				s = s.replace('  ', ' ')
-			
-			with timeout(seconds=30, error_message=f'"{s}" took too long to process!'):
-				try:
-					if (s := conditions_fun(s, *conditions_fun_args, **conditions_fun_kwargs)):
-						e = s
-					else:
-						skipped += 1
-				except KeyboardInterrupt:
-					sys.exit(f'User terminated program on example "{s}".')
+	skipped 	= 0
+	pages 		= []
+	parsed 		= []
+	
+	def draw_sentence() -> str:
+		# pick random examples/pages and split them into sentences
+		# in batches, since spaCy is much faster with pipe
+		if not pages:
+			rs 		= [int(random.random() * nrows) for _ in range(split_batch_size)]
+			pages.extend(split_sentences.pipe(dataset[r][data_field] for r in rs))
+			pages.reverse()
+		
+		# adding the strip here because spaCy can't deal with leading spaces or trailing spaces well
+		ex = [str(s).strip() for s in pages.pop().sents]
+		
+		# get a random sentence first and then check
+		# because most sentences will meet our criteria
+		# this way we don't parse all of them. 
+		# this should speed things up considerably
+		r2 = int(random.random() * (len(ex)-1))
+		s  = ex[r2]
 		
-		yield e
-	else:
+		# replace special space characters
+		for c in SPACE_CHARS:
+			s = s.replace(c, ' ')
+		
+		# spaCy doesn't handle extra spaces well
+		while '  ' in s:
+			s = s.replace('  ', ' ')
+		
+		return s
+	
+	nrows = len(dataset)-1
+	try:
+		for _ in (range(n) if n is not None else count()):
+			e = ''
+			while not e:
+				if parse_batch_size:
+					if not parsed:
+						# only parse the sentences that pass the string conditions,
+						# since most don't, and parsing is the slow part
+						ss = []
+						while len(ss) < parse_batch_size:
+							s = draw_sentence()
+							if string_conditions_fun(s):
+								ss.append(s)
+							else:
+								skipped += 1
+						
+						parsed = list(nlp_batch(ss))
+						parsed.reverse()
+					
+					# nlp_batch gives None for
+					# strings it couldn't parse
+					if (s := parsed.pop()) is None:
+						skipped += 1
+						continue
+				else:
+					s = draw_sentence()
+				
+				with timeout(seconds=30, error_message=f'"{s}" took too long to process!'):
+					try:
+						if (s := conditions_fun(s, *conditions_fun_args, **conditions_fun_kwargs)):
+							e = s
+						else:
+							skipped += 1
+					except KeyboardInterrupt:
+						sys.exit(f'User terminated program on example "{s}".')
+			
+			yield e
+	finally:
 		log.info(f'\n\nSkipped {skipped} sentences that did not meet conditions\n')
 
 def create_datasets_from_config(
@@ -391,7 +463,7 @@ def create_datasets_from_config(
 			log.info(f'Creating datasets for {name} using {source} (args={dataset_args}, kwargs={dataset_kwargs})')
 			
 			# unpack the config
-			conditions_fun		= config['sources'][source]['names'][name].get('conditions_fun', lambda s: nlp(s))
+			conditions_fun		= config['sources'][source]['names'][name].get('conditions_fun', lambda s: s if isinstance(s, EDoc) else nlp(s))
 			conditions_fun_args = config['sources'][source]['names'][name].get('conditions_fun_args', ())
 			conditions_fun_kwargs = config['sources'][source]['names'][name].get('conditions_fun_kwargs', {})
 			splits 				= config['sources'][source]['names'][name].get('splits', {})
@@ -401,6 +473,8 @@ def create_datasets_from_config(
 			metadata_fun 		= config['sources'][source]['names'][name].get('metadata_fun')
 			metadata_fun_args 	= config['sources'][source]['names'][name].get('metadata_fun_args', [])
 			metadata_fun_kwargs = config['sources'][source]['names'][name].get('metadata_fun_kwargs', {})
+			parse_batch_size 	= config['sources'][source]['names'][name].get('parse_batch_size')
+			string_conditions_fun = config['sources'][source]['names'][name].get('string_conditions_fun')
 			# dump_freq 			= config['sources'][source]['names'][name].get('dump_freq', DUMP_FREQ)
 			
 			# if we're loading from a file, we have to store these as strings,
@@ -421,6 +495,11 @@ def create_datasets_from_config(
 				exec(f'import {module}')
 				metadata_fun = eval(metadata_fun)	
 			
+			if isinstance(string_conditions_fun, str):
+				module = string_conditions_fun.rsplit('.', 1)[0]
+				exec(f'import {module}')
+				string_conditions_fun = eval(string_conditions_fun)
+			
 			create_seq2seq_dataset(
 				dataset=dataset,
 				data_split=data_split,
@@ -438,6 +517,8 @@ def create_datasets_from_config(
 				metadata_fun=metadata_fun,
 				metadata_fun_args=metadata_fun_args,
 				metadata_fun_kwargs=metadata_fun_kwargs,
+				parse_batch_size=parse_batch_size,
+				string_conditions_fun=string_conditions_fun,
 				# dump_freq=dump_freq,
 			)
 			
@@ -5,10 +5,11 @@ import random
 import logging
 import traceback
 
-from typing import Dict, Set, Union
+from typing import Dict, Set, Union, List
+from itertools import islice
 
 from ..language_funs import string_conditions
-from ...spacyutils import nlp, EDoc, flatten
+from ...spacyutils import nlp, EDoc, flatten, unique_tokens
 from ...constants import *
 
 log = logging.getLogger(__name__)
@@ -727,6 +728,9 @@ EXCLUDE_VERBS_CONDITIONS: Dict[str,Callable] = {
 	'born':		lambda t: not any(c.lemma_ in ['be', 'get'] for c in t.children),
 }
 
+# used to strip punctuation when looking for salts words
+PUNCTUATION_TABLE: Dict[int,None] = str.maketrans('', '', string.punctuation)
+
 SALTS_WORDS: Set[str] = {
 	'processing',
 	'versions',
@@ -1087,11 +1091,11 @@ def en_string_conditions(s: str) -> Union[bool,str]:
 	# this will remove sentences with abbreviations in the
 	# middle, but it will make sure we don't get junk like
 	# multiple sentences too
-	if re.search(r'\.', s[:-1]):
+	if s.find('.', 0, len(s) - 1) != -1:
 		return False
 	
 	# must be ascii when punctuation is removed
-	if not s.translate(s.maketrans('', '', string.punctuation)).isascii():
+	if not s.translate(PUNCTUATION_TABLE).isascii():
 		return False
 	
 	# English-specific filters
@@ -1109,22 +1113,26 @@ def en_string_conditions(s: str) -> Union[bool,str]:
 	
 	return s
 
-def basic_conditions(s: str, conjoined: bool = True) -> Union[bool,EDoc]:
+def basic_conditions(s: Union[str,EDoc], conjoined: bool = True) -> Union[bool,EDoc]:
 	'''
 	Basic conditions to clean up noisy data.
 	The main idea is to make sure we are reasonably
 	certain of getting a complete sentence that is 
 	correctly parsed. It's not foolproof, but it works
 	most of the time, and catches a lot of junk.
+	s can also be an EDoc that has already been parsed
+	(e.g., in a batch using nlp_batch), so that we
+	don't parse it again.
 	'''
-	s = en_string_conditions(s)
+	parsed = s if isinstance(s, EDoc) else None
+	s = en_string_conditions(str(s))
 	
 	if not s:
 		return False
 	
 	# now we have to parse
 	try:
-		s = nlp(s)
+		s = nlp(s) if parsed is None else parsed
 		
 		# bad deps contains generic dependencies
 		# spaCy assigns to things when it doesn't know
@@ -1216,14 +1224,14 @@ def basic_conditions(s: str, conjoined: bool = True) -> Union[bool,EDoc]:
 				su.append(s._get_partitive_head_noun(subj))
 		
 		su = flatten(su)
-		su = [t for i, t in enumerate(su) if not t.i in [t2.i for t2 in su[:i]]]
+		su = unique_tokens(su)
 		
 		for obj in o[:]:
 			if obj.text in ALL_PARTITIVES:
 				o.append(s._get_partitive_head_noun(obj))
 		
 		o  = flatten(o)
-		o  = [t for i, t in enumerate(o) if not t.i in [t2.i for t2 in o[:i]]]
+		o  = unique_tokens(o)
 		
 		if any(t.pos_ not in NOUN_POS_TAGS for t in su + o):
 			return False
@@ -1283,11 +1291,11 @@ def basic_conditions(s: str, conjoined: bool = True) -> Union[bool,EDoc]:
 		if any(
 			(
 				not v.is_aux and 
-				v.text in ['use', 'used'] and
+				v.text in USE_TO_FORMS and
 				any(t.dep_ == 'xcomp' for t in v.children)
 			) or (
 				v.is_aux and 
-				v.head.text in ['use', 'used'] and 
+				v.head.text in USE_TO_FORMS and 
 				any(t.dep_ == 'xcomp' for t in v.head.children)
 			)
 			for v in vs
@@ -1403,12 +1411,7 @@ def no_dist_conditions(s: str, conjoined: bool = True) -> Union[bool,EDoc]:
 						subj.append(p_head)
 			
 			# remove any duplicates
-			deduped_subjs = [subj[0]]
-			for t in subj:
-				if not any(t.i == t2.i for t2 in deduped_subjs):
-					deduped_subjs.append(t)
-			
-			subj = deduped_subjs
+			subj = unique_tokens(subj)
 			
 			if len(subj) > 1:
 				s_n = s._get_list_noun_number(subj)
@@ -1473,7 +1476,7 @@ def question_conditions(s: str, conjoined: bool = True) -> Union[bool,EDoc]:
 	# dependent of the verb in the sentence
 	subject = s.main_subject
 	if isinstance(subject,list):
-		subject_position = min([t.i for t in subject])
+		subject_position = min(t.i for t in subject)
 	else:
 		subject_position = subject.i
 	
@@ -1482,12 +1485,14 @@ def question_conditions(s: str, conjoined: bool = True) -> Union[bool,EDoc]:
 	else:
 		return s
 
-def salts_conditions(s: str, words: Set[str] = SALTS_WORDS) -> Union[bool,str]:
+def salts_conditions(s: Union[str,EDoc], words: Set[str] = SALTS_WORDS) -> Union[bool,str]:
 	'''
 	Sentences for the salts must have one
 	of a number of predefined words to be
 	useful. They must also meet the EN
-	string conditions.
+	string conditions. s can also be an EDoc
+	(e.g., parsed in a batch), but only its
+	string is used.
 	'''
 	if (
 		words in [
@@ -1499,19 +1504,30 @@ def salts_conditions(s: str, words: Set[str] = SALTS_WORDS) -> Union[bool,str]:
 	):
 		words = eval(words)
 	
-	s = en_string_conditions(s)
+	s = en_string_conditions(str(s))
 	if not s:
 		return False
 	
+	if not get_salts_words(s, words):
+		return False
+	
+	return s
+
+def get_salts_words(s: str, words: Set[str] = SALTS_WORDS) -> List[str]:
+	'''Get the word(s) in words that occur(s) in the sentence.'''
 	# the salts words have to be after the first word
 	# because they need to have a space before them in
 	# RoBERTa
-	split_s = set(s.translate(s.maketrans('', '', string.punctuation)).split()[1:])
+	split_s = s.translate(PUNCTUATION_TABLE).split()
 	
-	if not any(word in split_s for word in words):
-		return False
+	# only look up the words that are actually in the sentence,
+	# rather than checking every one of words. this streams the
+	# tokens through the set of words, so we don't have to build 
+	# a set of the tokens for every sentence
+	hits = words.intersection(islice(split_s, 1, None))
 	
-	return s
+	# keep the order of words if we find more than one
+	return [word for word in words if word in hits] if len(hits) > 1 else list(hits)
 
 def simple(s: str) -> Dict[str,EDoc]:
 	'''Puts a sentence into a dict.'''
@@ -1,20 +1,38 @@
-import string
+import sys
+import logging
 
-from ...spacyutils import EDoc
-from .grammar_funs import SALTS_WORDS
+from ...spacyutils import EDoc, nlp_batch, NLP_BATCH_SIZE, NLP_N_PROCESS
+from .grammar_funs import get_salts_words
 
-from typing import Dict, Union
+from typing import Dict, Union, Iterable, List, Tuple
+
+log = logging.getLogger(__name__)
+
+# returned for every sentence without a salts word,
+# so it must be treated as read-only. this is a dict
+# and not a MappingProxyType so that it can still be
+# written out with json.dump
+EMPTY_SALTS_METADATA: Dict[str,str] = dict(salts_word='')
 
 def get_salts_metadata(d: Dict) -> Dict:
 	'''Get the word(s) in salts that occur(s) in the sentence.'''
-	s = d['src']
-	s = set(s.translate(s.maketrans('', '', string.punctuation)).split()[1:])
+	words = get_salts_words(d['src'])
+	if not words:
+		return EMPTY_SALTS_METADATA
 	
-	words = [word for word in SALTS_WORDS if word in s]
 	words = ','.join(words)
 	
 	return dict(salts_word=words)
 
+def intern_seq(seq: List[str]) -> Tuple[str]:
+	'''
+	Convert a sequence of strings from the metadata to
+	a tuple of interned strings. Tags and structures come
+	from a small set, so this lets every row share them.
+	'''
+	if seq is not None:
+		return tuple(sys.intern(s) for s in seq)
+
 def get_source_metadata(source: Union[Dict,EDoc]) -> Dict:
 	"""
 	Gets basic metadata about the passed EDoc example.
@@ -25,8 +43,16 @@ def get_source_metadata(source: Union[Dict,EDoc]) -> Dict:
 	if isinstance(source,dict):
 		source = list(source.values())[0]
 	
-	if source.has_main_subject_verb_interveners:
-		final_intervener_number = source.main_subject_verb_interveners[-1].get_morph('Number')
+	# each of these is a property that traverses the parse,
+	# so we only look them up once
+	main_verb 				= source.main_verb
+	interveners 			= source.main_subject_verb_interveners
+	intervener_structures 	= intern_seq(source.main_subject_verb_intervener_structures)
+	distractors 			= source.main_subject_verb_distractors
+	distractor_structures 	= intern_seq(source.main_subject_verb_distractor_structures)
+	
+	if interveners:
+		final_intervener_number = interveners[-1].get_morph('Number')
 	else:
 		final_intervener_number = None
 	
@@ -55,17 +81,17 @@ def get_source_metadata(source: Union[Dict,EDoc]) -> Dict:
 	metadata = dict(
 				subject_number=main_subject_number,
 				object_number=source.main_object_number,
-				source_main_verb=source.main_verb.text,
-				source_main_verb_lemma=source.main_verb.lemma_,
-				n_interveners=len(source.main_subject_verb_interveners),
-				intervener_structures=source.main_subject_verb_intervener_structures,
+				source_main_verb=main_verb.text,
+				source_main_verb_lemma=main_verb.lemma_,
+				n_interveners=len(interveners),
+				intervener_structures=intervener_structures,
 				final_intervener_number=final_intervener_number,
-				final_intervener_structure=source.main_subject_verb_final_intervener_structure,
-				n_distractors=len(source.main_subject_verb_distractors),
-				distractor_structures=source.main_subject_verb_distractor_structures,
-				final_distractor_structure=source.main_subject_verb_final_distractor_structure,
-				pos_sequence=source.pos_seq,
-				tag_sequence=source.tag_seq,
+				final_intervener_structure=intervener_structures[-1] if intervener_structures else None,
+				n_distractors=len(distractors),
+				distractor_structures=distractor_structures,
+				final_distractor_structure=distractor_structures[-1] if distractor_structures else None,
+				pos_sequence=intern_seq(source.pos_seq),
+				tag_sequence=intern_seq(source.tag_seq),
 				src_history=source._history,
 			)
 	
@@ -83,17 +109,61 @@ def get_metadata(pair: Dict) -> Dict:
 	
 	metadata = get_source_metadata(source)
 	
-	if metadata['source_main_verb_lemma'] != target.main_verb.lemma_:
-		main_verb_lemmas = ','.join(list(dict.fromkeys([source.main_verb.lemma_, target.main_verb.lemma_])))
-	else:
-		main_verb_lemmas = 'both_ident'		
+	tgt_main_verb = target.main_verb
+	
+	src_lemma = metadata['source_main_verb_lemma']
+	tgt_lemma = tgt_main_verb.lemma_
+	main_verb_lemmas = 'both_ident' if src_lemma == tgt_lemma else f'{src_lemma},{tgt_lemma}'
 	
 	metadata.update(dict(
-		target_main_verb=target.main_verb.text,
-		target_main_verb_lemma=target.main_verb.lemma_,
+		target_main_verb=tgt_main_verb.text,
+		target_main_verb_lemma=tgt_lemma,
 		main_verb_lemmas=main_verb_lemmas,
 		tense=prefix,
 		tgt_history=target._history,
 	))
 	
-	return metadata
\ No newline at end of file
+	return metadata
+
+def get_metadata_batch(
+	pairs: Iterable[Dict],
+	batch_size: int = NLP_BATCH_SIZE,
+	n_process: int = NLP_N_PROCESS,
+) -> List[Dict]:
+	"""
+	Gets metadata about many examples at once.
+	Any sources or targets that are still strings are parsed together
+	using nlp_batch before getting the metadata for each example.
+	:param pairs: an iterable of dicts like those passed to get_metadata, except that 'src' and 'tgt' may be strs.
+	:returns list: a list of dictionaries recording metadata for each example, in order (None for examples that could not be parsed or whose metadata ran into an error)
+	"""
+	pairs = [dict(pair) for pair in pairs]
+	failed = set()
+	for key in ['src', 'tgt']:
+		to_parse = [i for i, pair in enumerate(pairs) if isinstance(pair[key], str)]
+		docs = nlp_batch(
+			(pairs[i][key] for i in to_parse),
+			batch_size=batch_size, 
+			n_process=n_process
+		)
+		for i, doc in zip(to_parse, docs):
+			if doc is None:
+				failed.add(i)
+			else:
+				pairs[i][key] = doc
+	
+	# one bad example shouldn't lose
+	# the metadata for the whole batch
+	metadata = []
+	for i, pair in enumerate(pairs):
+		if i in failed:
+			metadata.append(None)
+			continue
+		
+		try:
+			metadata.append(get_metadata(pair))
+		except Exception:
+			log.warning(f'Example "{pair["src"]}" ran into an error getting metadata!', exc_info=True)
+			metadata.append(None)
+	
+	return metadata
@@ -11,9 +11,14 @@ from ..constants import (
 	MAX_SENTENCE_LENGTH_IN_WORDS,
 	MIN_SENTENCE_LENGTH_IN_WORDS,
 	MIN_SENTENCE_LENGTH_IN_CHARS,
+	MAX_SENTENCE_LENGTH_IN_CHARS,
 	EXCLUSION_REGEXES
 )
 
+# one pass over the string for all of the exclusion regexes
+# instead of one search per regex
+EXCLUSION_REGEX: re.Pattern = re.compile('|'.join(f'(?:{regex})' for regex in EXCLUSION_REGEXES))
+
 def string_conditions(s: str) -> bool:
 	'''
 	Does the string pass certain basic checks?
@@ -21,23 +26,21 @@ def string_conditions(s: str) -> bool:
 	is noisy, so we filter out a lot of garbage here.
 	'''
 	
+	# checks are ordered so that the cheapest ones that reject
+	# the most noisy lines come first. the exclusion strings catch
+	# most garbage in naturalistic data, so they go before
+	# the regexes and anything that needs to split the string
+	
 	# must be longer than a single character
 	if len(s) < MIN_SENTENCE_LENGTH_IN_CHARS:
 		return False
 	
-	# must start with a capital letter
-	if s[0].islower():
-		return False
-	
-	# don't start with an acronym/abbreviation
-	if s.split()[0].isupper() and not len(s.split()[0]) == 1:
+	# too long, without having to count the words
+	if len(s) > MAX_SENTENCE_LENGTH_IN_CHARS:
 		return False
 	
-	# too long!
-	if len(s.split()) > MAX_SENTENCE_LENGTH_IN_WORDS:
-		return False
-	
-	if len(s.split()) < MIN_SENTENCE_LENGTH_IN_CHARS:
+	# must start with a capital letter
+	if s[0].islower():
 		return False
 	
 	# must not contain a semicolon (i.e., two sentences)
@@ -51,6 +54,22 @@ def string_conditions(s: str) -> bool:
 	if not any(s.endswith(c) for c in VALID_SENTENCE_ENDING_CHARS):
 		return False
 	
+	if EXCLUSION_REGEX.search(s):
+		return False
+	
+	words = s.split()
+	
+	# don't start with an acronym/abbreviation
+	if words[0].isupper() and not len(words[0]) == 1:
+		return False
+	
+	# too long!
+	if len(words) > MAX_SENTENCE_LENGTH_IN_WORDS:
+		return False
+	
+	if len(words) < MIN_SENTENCE_LENGTH_IN_CHARS:
+		return False
+	
 	# must not contain an odd number of parentheses (partial sentences)
 	for d1, d2 in DELIMITERS:
 		if s.count(d1) != s.count(d2):
@@ -68,7 +87,4 @@ def string_conditions(s: str) -> bool:
 			if s[::-1].index(d1) < s[::-1].index(d2):
 				return False
 	
-	if any(re.search(regex, s) for regex in EXCLUSION_REGEXES):
-		return False
-	
 	return True
\ No newline at end of file
@@ -3,16 +3,26 @@ Useful wrappers for editing spaCy
 Some early parts of this are inspired by
 https://github.com/chartbeat-labs/textacy/blob/main/src/textacy/spacier/utils.py
 '''
+import os
+import sys
+import json
 import inspect
 import logging
 
-from typing import Union, List, Dict, Set, Tuple
+from copy import copy
+from contextlib import contextmanager
+from typing import Any, Union, List, Dict, Set, Tuple, Iterable, Iterator, Callable
+from functools import wraps, lru_cache, cached_property
+from itertools import islice
 from collections import Counter
 
 import spacy
+import numpy as np
 
+from spacy.attrs import ORTH, SPACY, POS, TAG, HEAD, DEP, LEMMA, MORPH, SENT_START
 from spacy.tokens.doc import Doc
 from spacy.tokens.token import Token
+from spacy.tokens.morphanalysis import MorphAnalysis
 
 from pattern.en import lexeme # just to deal with a bug
 from pattern.en import singularize, pluralize
@@ -25,18 +35,168 @@ from .timeout import timeout
 
 log = logging.getLogger(__name__)
 
-nlp_ = spacy.load('en_core_web_trf', disable=['ner'])
+# run the transformer on the GPU if asked to.
+# this has to happen before the model is loaded
+USE_GPU: bool = os.environ.get('SPACY_GPU', '0') == '1'
+if USE_GPU:
+	spacy.require_gpu()
+
+# we exclude rather than disable ner so that
+# its weights are never loaded into memory.
+# the other components are all needed: the tagger
+# and parser for tags and dependencies, the attribute_ruler
+# for the pos and morph features (this model has no morphologizer),
+# and the lemmatizer, since lemmas are used to find auxes, 'be',
+# and verbs that need special handling
+nlp_ = spacy.load('en_core_web_trf', exclude=['ner'])
+
+# make sure a different version of the model hasn't
+# added or dropped components, since anything extra
+# slows down parsing, and anything missing breaks it
+NLP_PIPES: Set[str] = {'transformer', 'tagger', 'parser', 'attribute_ruler', 'lemmatizer'}
+if set(nlp_.pipe_names) != NLP_PIPES:
+	log.warning(
+		f'Expected spaCy components {sorted(NLP_PIPES)}, but got {nlp_.pipe_names}. '
+		'Parses may be slower or missing features.'
+	)
+
+# how many strings to parse at once with nlp_.pipe.
+# a smaller batch uses less memory, which can help
+# when running the transformer on a GPU
+NLP_BATCH_SIZE: int = int(os.environ.get('SPACY_BATCH_SIZE', 256))
+
+# how many processes to parse with in nlp_.pipe.
+# -1 uses one per CPU, which is much faster for large
+# corpora when not using the GPU
+NLP_N_PROCESS: int = int(os.environ.get('SPACY_N_PROCESS', 1))
+
+# how many seconds nlp_batch allows for each string
+# in a batch before timing out
+NLP_BATCH_TIMEOUT: int = 2
+
+# the morphs to fix for each word, and whether
+# to fix them only in the present tense. this lets
+# us check for both kinds of fixes with one lookup
+MORPH_FIXES: Dict[str,Tuple[Dict[str,str],bool]] = {
+	**{text: (morph, True) for text, morph in INCORRECT_MORPHS_PRESENT_TENSE.items()},
+	**{text: (morph, False) for text, morph in INCORRECT_MORPHS.items()},
+}
+
+# the integer ids of the deps we check on the underlying
+# spaCy tokens. comparing these to Token.dep lets us skip
+# looking up the string for each token's dep. we get these
+# from the vocab since common labels have fixed symbol ids
+# rather than hashes
+SUBJ_DEP_IDS: Set[int] = {nlp_.vocab.strings.add(dep) for dep in SUBJ_DEPS}
+OBJ_DEP_IDS: Set[int] = {nlp_.vocab.strings.add(dep) for dep in OBJ_DEPS}
+ROOT_DEP_ID: int = nlp_.vocab.strings.add('ROOT')
+XCOMP_DEP_ID: int = nlp_.vocab.strings.add('xcomp')
+NEG_DEP_IDS: Set[int] = {nlp_.vocab.strings.add('neg')}
+
+# the attributes used to make copies of a Doc, in the
+# order Doc.__init__ sets them. copies are made by editing
+# an array of these and loading it with Doc.from_array, so
+# we only need to look up the strings for the edited tokens.
+# entities aren't copied, since ner is excluded
+DOC_ARRAY_ATTRS: List[int] = [POS, HEAD, DEP, LEMMA, TAG, MORPH, SENT_START]
+DOC_ARRAY_HEAD: int = DOC_ARRAY_ATTRS.index(HEAD)
+DOC_ARRAY_DEP: int = DOC_ARRAY_ATTRS.index(DEP)
+DOC_ARRAY_SENT_START: int = DOC_ARRAY_ATTRS.index(SENT_START)
+
+# the arrays hold uint64s, so negative values
+# (heads to the left, non-sentence starts)
+# are stored modulo this
+UINT64_MOD: int = 2**64
+
+# the form of each homophonous verb for each number and
+# tense, so we can get a form with one lookup. number
+# can also be 'any' for forms that don't depend on number
+HOMOPHONOUS_VERB_FORMS: Dict[Tuple[str,str,str],str] = {
+	(text, number, tense): form
+	for text, forms in HOMOPHONOUS_VERBS.items()
+		for number, tenses in forms.items() if number != 'condition'
+			for tense, form in tenses.items()
+}
 
 # how many times to look up for a subject
 # when determining whether a sentence can form a polar question
 LOOK_FOR_SUBJECTS_LIMIT: int = 10
 
-def flatten(items: 'Iterable', seqtypes: Tuple['Class'] = (list, tuple)):
-	for i, x in enumerate(items):
-		while i < len(items) and isinstance(items[i], seqtypes):
-			items[i:i+1] = items[i]
+def flatten(items: 'Iterable', seqtypes: Tuple['Class'] = (list, tuple)) -> List:
+	'''Returns a new list with the contents of any nested seqtypes in items.'''
+	flattened = []
+	iterators = [iter(items)]
+	while iterators:
+		for x in iterators[-1]:
+			if isinstance(x, seqtypes):
+				iterators.append(iter(x))
+				break
+			
+			flattened.append(x)
+		else:
+			iterators.pop()
+	
+	return flattened
+
+def listify(x: Union[Any,List]) -> List:
+	'''Returns x if it is a list, and a list containing x otherwise.'''
+	return x if isinstance(x, list) else [x]
+
+def unique_tokens(tokens: List[Union[Token,'EToken']]) -> List[Union[Token,'EToken']]:
+	'''
+	Returns the tokens with duplicate indices removed,
+	keeping the first token with each index.
+	'''
+	seen = set()
+	unique = []
+	for t in tokens:
+		if not t.i in seen:
+			seen.add(t.i)
+			unique.append(t)
+	
+	return unique
+
+def _copy_etokens(x: Union['EToken',List['EToken']]) -> Union['EToken',List['EToken']]:
+	'''Copy (lists of) ETokens, leaving anything else as is.'''
+	if isinstance(x, list):
+		return [_copy_etokens(t) for t in x]
 	
-	return items
+	return copy(x) if isinstance(x, EToken) else x
+
+def cached_copied_property(f: Callable) -> property:
+	'''
+	Like functools.cached_property, but every access
+	returns a copy of the cached value, so that callers
+	can't modify the cache. This is for properties that
+	return ETokens (which get edited in place to make new
+	EDocs) or lists (of ETokens or strings), which callers
+	may change. Lists and ETokens are copied (recursively,
+	for nested lists); anything else is returned as is.
+	'''
+	key = f'_cached_{f.__name__}'
+	
+	@wraps(f)
+	def wrapper(self):
+		if key not in self.__dict__:
+			self.__dict__[key] = f(self)
+		
+		return _copy_etokens(self.__dict__[key])
+	
+	return property(wrapper)
+
+def _wrap(token: Token, cache: Dict[int,'EToken']) -> 'EToken':
+	'''
+	Get an EToken for a token from a Doc, using
+	a cache of ETokens for that Doc. Each token is only
+	wrapped once, and every call after that returns a copy
+	of the cached EToken, since ETokens get edited in place.
+	'''
+	t = cache.get(token.i)
+	if t is None:
+		t = cache[token.i] = EToken(token)
+		t._cache = cache
+	
+	return copy(t)
 
 # workaround for pattern.en bug in python > 3.6
 try:
@@ -44,15 +204,200 @@ try:
 except RuntimeError:
 	pass
 
+# a table of verb inflections made by make_verb_inflections.py,
+# in the same format as CONJUGATE_MAP. if it exists, we look verbs
+# up there before falling back to pattern.en, which is much slower
+VERB_INFLECTIONS_FILE: str = os.path.join(os.path.dirname(__file__), '..', 'data', 'verb_inflections.json')
+
+try:
+	with open(VERB_INFLECTIONS_FILE, 'rt', encoding='utf-8') as in_file:
+		VERB_INFLECTIONS: Dict[str,Dict[str,Dict[str,str]]] = json.load(in_file)
+except FileNotFoundError:
+	VERB_INFLECTIONS: Dict[str,Dict[str,Dict[str,str]]] = {}
+
+# a table of the singular and plural of nouns made by
+# make_noun_inflections.py. like the verb table, we look
+# nouns up here before falling back to pattern.en
+NOUN_INFLECTIONS_FILE: str = os.path.join(os.path.dirname(__file__), '..', 'data', 'noun_inflections.json')
+
+try:
+	with open(NOUN_INFLECTIONS_FILE, 'rt', encoding='utf-8') as in_file:
+		NOUN_INFLECTIONS: Dict[str,Dict[str,str]] = json.load(in_file)
+except FileNotFoundError:
+	NOUN_INFLECTIONS: Dict[str,Dict[str,str]] = {}
+
+# pattern.en is slow, but its results only
+# depend on the arguments, so we memoize them
+@lru_cache(maxsize=50000)
+def _singularize(s: str) -> str:
+	text = NOUN_INFLECTIONS.get(s, {}).get(SG)
+	if text:
+		return text
+	
+	if NOUN_INFLECTIONS:
+		log.debug(f'"{s}" is not in the noun inflection table; using pattern.en')
+	
+	return singularize(s)
+
+@lru_cache(maxsize=50000)
+def _pluralize(s: str) -> str:
+	text = NOUN_INFLECTIONS.get(s, {}).get(PL)
+	if text:
+		return text
+	
+	if NOUN_INFLECTIONS:
+		log.debug(f'"{s}" is not in the noun inflection table; using pattern.en')
+	
+	return pluralize(s)
+
+@lru_cache(maxsize=50000)
+def _conjugate(s: str, **kwargs) -> str:
+	# the table only has number and tense
+	if set(kwargs) <= {'number', 'tense'}:
+		text = VERB_INFLECTIONS.get(s, {}).get(kwargs.get('number', 'any'), {}).get(kwargs.get('tense'))
+		if text:
+			return text
+		
+		if VERB_INFLECTIONS:
+			log.debug(f'"{s}" ({kwargs}) is not in the verb inflection table; using pattern.en')
+	
+	return conjugate(s, **kwargs)
+
 class ParseError(Exception):
 	pass
 
-def nlp(s: str) -> 'EDoc':
+# how many parses nlp keeps. the same sentence is often
+# parsed more than once (e.g., when it is drawn again
+# from a dataset), and since Docs are never edited
+# in place, EDocs can share them
+NLP_CACHE_SIZE: int = 4096
+
+@lru_cache(maxsize=NLP_CACHE_SIZE)
+def _parse(s: str) -> Doc:
+	'''
+	Parse a string with all components.
+	The transformer output isn't used once
+	the string is parsed, so we drop it to keep
+	the cached Docs small.
+	'''
+	doc = nlp_(s)
+	if doc.has_extension('trf_data'):
+		doc._.trf_data = None
+	
+	return doc
+
+def nlp(s: str, disable: List[str] = None) -> 'EDoc':
+	'''
+	Parse a string into an EDoc.
+	Components in disable are not run.
+	'''
 	with timeout(error_message=f'"{s}" took too long to process!'):
 		try:
-			return EDoc(nlp_(s))
+			return EDoc(_parse(s) if not disable else nlp_(s, disable=disable))
+		except Exception as e:
+			raise ParseError(f'"{s}" ran into a parsing error!') from e
+
+def nlp_batch(
+	ss: Iterable[str],
+	batch_size: int = NLP_BATCH_SIZE,
+	n_process: int = NLP_N_PROCESS,
+	disable: List[str] = None,
+) -> Iterator['EDoc']:
+	'''
+	Parse many strings at once using nlp_.pipe,
+	which is much faster than calling nlp on each one.
+	Yields an EDoc for each string, in order.
+	Components in disable are not run.
+	With n_process > 1 (or -1, for one per CPU), strings
+	are parsed in parallel. This only works on the CPU,
+	so only one process is used when running on the GPU.
+	Strings are parsed a chunk at a time. If a chunk
+	raises an error or times out, its strings are parsed
+	one at a time with nlp instead, and None is yielded
+	for any string that still fails, so that the output
+	lines up with ss.
+	'''
+	disable = [] if disable is None else disable
+	
+	# forked processes can't share the GPU
+	if USE_GPU and n_process != 1:
+		log.warning(f'Parsing with one process instead of {n_process}, since spaCy is using the GPU.')
+		n_process = 1
+	
+	# give each process a full batch from every chunk
+	chunk_size = batch_size * (os.cpu_count() if n_process == -1 else max(n_process, 1))
+	ss = iter(ss)
+	while chunk := list(islice(ss, chunk_size)):
+		try:
+			with timeout(seconds=NLP_BATCH_TIMEOUT * len(chunk), error_message=f'A batch of {len(chunk)} strings took too long to process!'):
+				docs = list(nlp_.pipe(chunk, batch_size=batch_size, n_process=n_process, disable=disable))
+			
+			# as in _parse, the transformer output isn't
+			# used after parsing, so don't hold on to it
+			for doc in docs:
+				if doc.has_extension('trf_data'):
+					doc._.trf_data = None
+			
+			docs = [EDoc(doc) for doc in docs]
 		except Exception:
-			raise ParseError(f'"{s}" ran into a parsing error!')
+			log.warning(f'Parsing a batch of {len(chunk)} strings failed; parsing them one at a time.', exc_info=True)
+			docs = []
+			for s in chunk:
+				try:
+					docs.append(nlp(s, disable=disable))
+				except (ParseError, TimeoutError):
+					log.warning(f'Skipping "{s}", which could not be parsed.', exc_info=True)
+					docs.append(None)
+		
+		yield from docs
+
+def analyze_corpus(
+	ss: Iterable[str],
+	features: List[str],
+	batch_size: int = NLP_BATCH_SIZE,
+	n_process: int = NLP_N_PROCESS,
+) -> Iterator[Dict]:
+	'''
+	Parse many strings using nlp_batch and get
+	the EDoc properties named in features for each.
+	Yields a dict mapping each feature to its value
+	for each string, in order. Features that can't be
+	gotten for a string (usually because spaCy misparsed it)
+	are None.
+	'''
+	for doc in nlp_batch(ss, batch_size=batch_size, n_process=n_process):
+		if doc is None:
+			yield {feature: None for feature in features}
+			continue
+		
+		analysis = {}
+		for feature in features:
+			try:
+				analysis[feature] = getattr(doc, feature)
+			except Exception:
+				analysis[feature] = None
+		
+		yield analysis
+
+@contextmanager
+def disable_history() -> Iterator[None]:
+	'''Don't record the history of EDocs created in this context.'''
+	track_history = EDoc.TRACK_HISTORY
+	EDoc.TRACK_HISTORY = False
+	try:
+		yield
+	finally:
+		EDoc.TRACK_HISTORY = track_history
+
+@contextmanager
+def enable_history() -> Iterator[None]:
+	'''Record the history of EDocs created in this context.'''
+	track_history = EDoc.TRACK_HISTORY
+	EDoc.TRACK_HISTORY = True
+	try:
+		yield
+	finally:
+		EDoc.TRACK_HISTORY = track_history
 
 class EToken():
 	'''
@@ -74,6 +419,13 @@ class EToken():
 		if token is not None and d is not None:
 			raise ValueError('At most one of token or d may be provided!')
 		
+		# ETokens for other tokens in the same Doc
+		self._cache = {}
+		
+		# an index for the head that overrides the actual head
+		# when the token is copied into a new doc
+		self._head_i = None
+		
 		if d is None:
 			self._token 		= token
 			self.text 			= token.text
@@ -101,13 +453,12 @@ class EToken():
 		if self.i == 0:
 			self.is_sent_start = True
 		
-		if self.text in INCORRECT_MORPHS:
-			self.set_morph(**INCORRECT_MORPHS[self.text])
-		elif (
-			self.text in INCORRECT_MORPHS_PRESENT_TENSE and 
-			self.get_morph('Tense') == 'Pres'
+		morph_fix = MORPH_FIXES.get(self.text)
+		if (
+			morph_fix is not None and
+			(not morph_fix[1] or self.get_morph('Tense') == 'Pres')
 		):
-			self.set_morph(**INCORRECT_MORPHS_PRESENT_TENSE[self.text])	
+			self.set_morph(**morph_fix[0])
 		elif (
 			self.pos_ == 'VERB' and
 			self.get_morph('Tense') == 'Pres' and
@@ -125,6 +476,18 @@ class EToken():
 		if self.text in INCORRECT_POS:
 			self.pos_ = INCORRECT_POS[self.text]
 	
+	def __copy__(self) -> 'EToken':
+		'''
+		Returns a copy of the token. The parsed morph 
+		is copied too, since set_morph edits it in place.
+		'''
+		t = EToken.__new__(EToken)
+		t.__dict__.update(self.__dict__)
+		if t._morph_dict is not None:
+			t._morph_dict = dict(t._morph_dict)
+		
+		return t
+	
 	def __len__(self) -> int:
 		'''Returns the length in characters of the token text.'''
 		return len(self.text)
@@ -154,12 +517,38 @@ class EToken():
 		not doing it this way would recursively cast every
 		EToken to a head redundantly up the tree.
 		'''
-		return EToken(self._head) if not self.dep_ == 'ROOT' else self
+		if self.dep_ == 'ROOT':
+			return self
+		
+		if isinstance(self._head, Token):
+			return _wrap(self._head, self._cache)
+		
+		return EToken(self._head)
 	
 	@head.setter
 	def head(self, t: Union[Token,'EToken']) -> None:
 		self._head = t
 	
+	@property
+	def head_i(self) -> int:
+		'''
+		The index of the head of the token. 
+		This reads the index directly, without casting
+		the head to an EToken. If head_i has been set,
+		that value is used instead.
+		'''
+		if self._head_i is not None:
+			return self._head_i
+		
+		if self.dep_ == 'ROOT':
+			return self.i
+		
+		return self._head.i
+	
+	@head_i.setter
+	def head_i(self, i: int) -> None:
+		self._head_i = i
+	
 	@classmethod
 	def from_definition(
 		cls,
@@ -224,13 +613,25 @@ class EToken():
 	def rights(self) -> 'EToken':
 		'''Generator for the underlying Token's rights attribute.'''
 		for t in self._token.rights:
-			yield EToken(t)
+			yield _wrap(t, self._cache)
 	
 	@property
 	def children(self) -> 'EToken':
 		'''Generator for the underlying Token's children attribute.'''
 		for t in self._token.children:
-			yield EToken(t)
+			yield _wrap(t, self._cache)
+	
+	def _has_child_with_dep(self, dep: int) -> bool:
+		'''Does the underlying Token have a child with the dependency id dep?'''
+		return any(t.dep == dep for t in self._token.children)
+	
+	def _children_with_deps(self, deps: Set[int]) -> List['EToken']:
+		'''
+		The children with one of the dependency ids in deps.
+		This filters the underlying Token's children first,
+		so only the matching children are cast to EToken.
+		'''
+		return [_wrap(t, self._cache) for t in self._token.children if t.dep in deps]
 	
 	@property
 	def is_aux(self) -> bool:
@@ -256,7 +657,7 @@ class EToken():
 	def can_be_inflected(self) -> bool:
 		'''Can the (VERB) token be reinflected?'''
 		return (
-			not self.tag_ in ['VBN', 'VBG'] and
+			not self.tag_ in PARTICIPLE_TAGS and
 			(
 				self.is_verb or 
 				(self.is_aux and self.lemma_ in INFLECTED_AUXES)
@@ -323,13 +724,13 @@ class EToken():
 		'''Is the (VERB) token inflected?'''
 		return self.is_past_tense or self.is_present_tense	
 	
-	@property
+	@cached_copied_property
 	def determiner(self) -> Union['EToken',List['EToken']]:
 		'''Returns the determiner(s) associated with the token.'''
 		d = [
 			c 
 			for c in self.children 
-				if 	c.dep_ in ['det', 'nummod'] or 
+				if 	c.dep_ in DET_DEPS or 
 					(c.dep_ == 'amod' and c.text in AMOD_DETERMINERS)
 		]
 		
@@ -343,12 +744,13 @@ class EToken():
 	@property
 	def object(self) -> Union['EToken',List['EToken']]:
 		'''Return the object(s) of the token.'''
-		o = [t for t in self.children if t.dep_ in OBJ_DEPS]
+		o = self._children_with_deps(OBJ_DEP_IDS)
 		s = self.subject
 		if not isinstance(s,list):
 			s = [s] if s is not None else []
 		
-		o = [t for t in o if not any(t.i == t2.i for t2 in s)]
+		s = {t.i for t in s}
+		o = [t for t in o if not t.i in s]
 		if len(o) == 1:
 			return o[0]
 		elif len(o) > 1:
@@ -357,7 +759,8 @@ class EToken():
 	@property
 	def subject(self) -> Union['EToken',List['EToken']]:
 		'''Return the subject(s) of the token.'''
-		s = [t for t in self.children if t.dep_ in SUBJ_DEPS]
+		s = self._children_with_deps(SUBJ_DEP_IDS)
+		head = self.head
 		
 		# in passives, spaCy parses the participle as the main verb
 		# and assigns it the dependency to the subject
@@ -366,10 +769,10 @@ class EToken():
 		# to the participle instead, so we go through the head
 		# of the auxpass = main_verb
 		if not s:
-			s = [t for t in self.head.children if t.dep_ in SUBJ_DEPS]
+			s = head._children_with_deps(SUBJ_DEP_IDS)
 		
 		if not s and self.is_aux:
-			s = self.head.subject if not self.dep_ == 'ROOT' else None
+			s = head.subject if not self.dep_ == 'ROOT' else None
 		
 		# this means we don't actually have a subject
 		# sentence fragment, misparsed, or ungrammatical
@@ -379,52 +782,30 @@ class EToken():
 		# now that we know we have something,
 		# check for edge cases involve expletive/locative
 		# inversion
-		if not isinstance(s,list):
-			s = [s]
-		
-		if (
-			all(t.dep_ == 'expl' for t in s) and 			 # there
-			(
-				any(t.dep_ == 'xcomp' for t in self.children) or # to
-				(self.is_aux and any(t.dep_ == 'xcomp' for t in self.head.children))
-			)
-		):
-			ref_token = (
-				self 
-				if not (self.is_aux and any(t.dep_ == 'xcomp' for t in self.head.children)) 
-				else self.head
-			)
-			# there used/seems to be/have been [subj]
-			if any(t.lemma_ == 'be' for t in ref_token.children): # be
-				s.extend([
-					t for t in [
-						t for t in ref_token.children if t.lemma_ == 'be'
-					][0].children
-						if t.dep_ in SUBJ_DEPS
-				])
-			elif any(t.is_verb for t in ref_token.children):
-				# unaccusatives with there-inversion embedded under raising
-				# in these cases, the actual inverted subject gets
-				# misparsed as the object. this should not catch anything
-				# else with an object dependency, since there inversion
-				# without be can only happen with unaccusatives to begin with
-				s.extend([
-					t for t in [
-						t for t in ref_token.children if t.is_verb
-					][0].children
-						if t.dep_ in OBJ_DEPS
-				])
-		elif (
-			all(t.dep_ == 'expl' for t in s) and 
-			(
-				not self.lemma_ == 'be' or
-				(self.is_aux and not any(t.lemma_ == 'be' for t in self.head.children))
-			)
-		):  # misparsed "there" with unaccusatives without raising
-			ref_token = self if not (self.is_aux and not any(t.lemma_ == 'be' for t in self.head.children)) else self.head
-			s.extend([
-				t for t in ref_token.children if t.dep_ in OBJ_DEPS	
-			])
+		s = listify(s)
+		
+		if all(t.dep_ == 'expl' for t in s): # there
+			head_has_xcomp = self.is_aux and head._has_child_with_dep(XCOMP_DEP_ID)
+			if self._has_child_with_dep(XCOMP_DEP_ID) or head_has_xcomp: # to
+				ref_token = self if not head_has_xcomp else head
+				# there used/seems to be/have been [subj]
+				be = next((t for t in ref_token.children if t.lemma_ == 'be'), None)
+				verb = next((t for t in ref_token.children if t.is_verb), None) if be is None else None
+				if be is not None: # be
+					s.extend(be._children_with_deps(SUBJ_DEP_IDS))
+				elif verb is not None:
+					# unaccusatives with there-inversion embedded under raising
+					# in these cases, the actual inverted subject gets
+					# misparsed as the object. this should not catch anything
+					# else with an object dependency, since there inversion
+					# without be can only happen with unaccusatives to begin with
+					s.extend(verb._children_with_deps(OBJ_DEP_IDS))
+			else:
+				head_lacks_be = self.is_aux and not any(t.lemma_ == 'be' for t in head.children)
+				if not self.lemma_ == 'be' or head_lacks_be:
+					# misparsed "there" with unaccusatives without raising
+					ref_token = self if not head_lacks_be else head
+					s.extend(ref_token._children_with_deps(OBJ_DEP_IDS))
 		
 		# attrs only really count as subjectss
 		# if they have a correlate with a real
@@ -461,22 +842,49 @@ class EToken():
 		'''Is the token intransitive?'''
 		return not self.is_transitive	
 	
+	@property
+	def morph(self) -> Union['MorphAnalysis',str]:
+		'''
+		The morphological information of the token.
+		After set_morph, this is only rebuilt
+		from the dictionary when it's needed.
+		'''
+		if self._morph is None:
+			self._morph = self._dict_to_morph(self._morph_dict)
+		
+		return self._morph
+	
+	@morph.setter
+	def morph(self, m: Union['MorphAnalysis',str]) -> None:
+		self._morph = m
+		self._morph_dict = None
+	
 	@property
 	def _morph_to_dict(self) -> Dict[str,str]:
-		'''Get the morphological information as a dictionary.'''
-		m = str(self.morph)
-		if m:
-			d = {k: v for k, v in [f.split('=') for f in m.split('|')]}
-		else:
-			d = {}	
+		'''
+		Get the morphological information as a dictionary.
+		This is parsed once and then kept, so it
+		should not be modified except by set_morph.
+		'''
+		if self._morph_dict is None:
+			m = self._morph
+			# spaCy can give us the dict directly
+			if isinstance(m, MorphAnalysis):
+				self._morph_dict = m.to_dict()
+				return self._morph_dict
+			
+			m = str(m)
+			if m:
+				self._morph_dict = dict(f.split('=', 1) for f in m.split('|'))
+			else:
+				self._morph_dict = {}
 		
-		return d	
+		return self._morph_dict
 	
 	@staticmethod
 	def _dict_to_morph(d: Dict[str,str]) -> str:
 		'''Convert a dict to morph format.'''
-		d = {k: v for k, v in d.items() if v is not None}
-		return '|'.join(['='.join([str(k), str(v)]) for k, v in d.items()])
+		return '|'.join(f'{k}={v}' for k, v in d.items() if v is not None)
 	
 	def set_morph(self, **kwargs) -> Dict:
 		'''
@@ -484,12 +892,21 @@ class EToken():
 		Use kwarg=None to remove a property.
 		'''
 		d = self._morph_to_dict
-		d = {**d, **kwargs}
-		d = {k: v for k, v in d.items() if v is not None}
-		self.morph = self._dict_to_morph(d)
+		for k, v in kwargs.items():
+			if v is None:
+				d.pop(k, None)
+			else:
+				d[k] = v
+		
+		# the string is rebuilt when it's next needed
+		self._morph = None
 	
 	def get_morph(self, *args) -> Union[str,List[str]]:
 		'''Returns the morphs in args that exist.'''
+		# most of the time, we only want one
+		if len(args) == 1:
+			return self._morph_to_dict.get(args[0]) or None
+		
 		ms = [self._morph_to_dict.get(k) for k in args]
 		ms = [m for m in ms if m]
 		if len(ms) == 1:
@@ -506,17 +923,17 @@ class EToken():
 				f"not a numbered det/noun!"
 			)
 		
-		if NUMBER_MAP[number] == SG:
-			self.singularize()
-		elif NUMBER_MAP[number] == PL:
-			self.pluralize()
+		f = RENUMBER_FUNS.get(NUMBER_MAP[number])
+		if f is not None:
+			f(self)
 	
 	def singularize(self) -> None:
 		'''Make a (NOUN) token singular.'''
 		if not self.get_morph('Number') == 'Sing':
 			# bug in pattern.en.singularize and pluralize: don't deal with capital letters correctly
 			# need to add exceptions: this doesn't work for 'these', 'those', 'all', etc. 
-			self.text = SINGULARIZE_MAP.get(self.text.lower(), singularize(self.text.lower()))
+			text = self.text.lower()
+			self.text = SINGULARIZE_MAP[text] if text in SINGULARIZE_MAP else _singularize(text)
 			self.text = (self.text[0].upper() if self.is_sent_start else self.text[0]) + self.text[1:]
 			self.set_morph(Number='Sing')
 			self.tag_ = 'NN'
@@ -524,11 +941,28 @@ class EToken():
 	def pluralize(self) -> None:
 		'''Make a (NOUN) token plural.'''
 		if not self.get_morph('Number') == 'Plur':
-			self.text = PLURALIZE_MAP.get(self.text.lower(), pluralize(self.text.lower()))
+			text = self.text.lower()
+			self.text = PLURALIZE_MAP[text] if text in PLURALIZE_MAP else _pluralize(text)
 			self.text = (self.text[0].upper() if self.is_sent_start else self.text[0]) + self.text[1:]
 			self.set_morph(Number='Plur')
 			self.tag_ = 'NNS'
 	
+	def renumber_determiner(self, number: str) -> None:
+		'''
+		Make a (DET) token agree with a noun of the given number.
+		Determiners without a number feature (like 'the') are
+		left as they are.
+		'''
+		number = NUMBER_MAP[number]
+		text = self.text.lower()
+		if text in DETERMINERS_WITHOUT_NUMBER_FORM[number]:
+			raise ValueError(f'"{self.text}" has no {"singular" if number == SG else "plural"} form!')
+		
+		if self.get_morph('Number') and text in DETERMINER_RENUMBER_MAP[number]:
+			self.text = DETERMINER_RENUMBER_MAP[number][text]
+			self.text = (self.text[0].upper() if self.is_sent_start else self.text[0]) + self.text[1:]
+			self.set_morph(Number='Sing' if number == SG else 'Plur')
+	
 	def reinflect(
 		self, 
 		number: str = None, 
@@ -545,6 +979,9 @@ class EToken():
 		number = self.get_morph('Number') if number is None else number
 		tense  = self.get_morph('Tense') if tense is None else tense
 		
+		mapped_number 	= NUMBER_MAP.get(number)
+		mapped_tense 	= TENSE_MAP.get(tense)
+		
 		# used to cannot be made present tense 
 		# (*He uses to, *They use to)
 		if (
@@ -558,7 +995,7 @@ class EToken():
 		
 		# we need to filter out Nones, in case the current word
 		# doesn't have these morphs
-		c_kwargs = dict(number=NUMBER_MAP.get(number), tense=TENSE_MAP.get(tense))
+		c_kwargs = dict(number=mapped_number, tense=mapped_tense)
 		c_kwargs = {k: v for k, v in c_kwargs.items() if v is not None}
 		c_kwargs = {**c_kwargs, **kwargs}
 		
@@ -572,7 +1009,7 @@ class EToken():
 		elif CONJUGATE_MAP.get(self.text, {}).get('any', {}).get(c_kwargs.get('tense'), {}):
 			text = CONJUGATE_MAP[self.text]['any'][c_kwargs['tense']]
 		else:
-			text = conjugate(self.text, **c_kwargs)
+			text = _conjugate(self.text, **c_kwargs)
 		
 		# if conjugation has produced an empty 
 		# string, something has gone wrong
@@ -585,8 +1022,8 @@ class EToken():
 		# capitalize if we're at the beginning of a sentence
 		self.text = text if not self.is_sent_start else (text[0].upper() + text[1:])
 		
-		n = 'Sing' if NUMBER_MAP.get(number) == SG else 'Plur' if NUMBER_MAP.get(number) == PL else None
-		t = 'Past' if TENSE_MAP.get(tense) == PAST else 'Pres' if TENSE_MAP.get(tense) == PRESENT else None
+		n = 'Sing' if mapped_number == SG else 'Plur' if mapped_number == PL else None
+		t = 'Past' if mapped_tense == PAST else 'Pres' if mapped_tense == PRESENT else None
 		
 		m_kwargs = dict(Number=n, Tense=t)
 		if tense == INFINITIVE:
@@ -596,14 +1033,14 @@ class EToken():
 		
 		self.set_morph(**m_kwargs)
 		
-		if TENSE_MAP.get(tense) == PAST:
+		if mapped_tense == PAST:
 			self.tag_ = 'VBD'
-		elif TENSE_MAP.get(tense) == INFINITIVE:
+		elif mapped_tense == INFINITIVE:
 			self.tag_ = 'VB'
-		elif TENSE_MAP.get(tense) == PRESENT:
-			if NUMBER_MAP.get(number) == SG:
+		elif mapped_tense == PRESENT:
+			if mapped_number == SG:
 				self.tag_ = 'VBZ'
-			elif NUMBER_MAP.get(number) == PL:
+			elif mapped_number == PL:
 				self.tag_ = 'VBP'
 	
 	def make_past_tense(self, number: str) -> None:
@@ -618,10 +1055,25 @@ class EToken():
 		'''Make the (VERB) token infinitive.'''
 		self.reinflect(tense=INFINITIVE)
 
+# the aux used for do-support in questions, which
+# is copied so that it is only created and formatted once
+Q_DO_TOKEN: EToken = EToken.from_definition(**Q_DO, whitespace_=' ')
+
+# the EToken method that changes a token to each number
+RENUMBER_FUNS: Dict[str,Callable] = {
+	SG: EToken.singularize,
+	PL: EToken.pluralize,
+}
+
 class EDoc():
 	'''
 	Wrapper around spaCy Doc to implement useful methods.
 	'''
+	# whether to record how each EDoc was created.
+	# this is used for the history in the metadata,
+	# but can be turned off using disable_history
+	TRACK_HISTORY: bool = True
+	
 	def __init__(
 		self,
 		Doc: Doc = None, 
@@ -643,20 +1095,41 @@ class EDoc():
 		self.user_data = Doc.user_data
 		self.previous = previous
 		
-		# keep the history so we can recreate this object exactly
-		# but get it in an informative way that excludes the mostly internal functions
-		stack = inspect.stack()
+		# ETokens for the tokens in the Doc, so that
+		# each one is only created once
+		self._etoken_cache = {}
+		
+		# the attributes used to make copies of the Doc,
+		# which are also only collected once
+		self._doc_array = None
+		
+		# conjuncts and paths for tokens in the Doc, by index.
+		# these are also copied before being returned
+		self._conjuncts_cache = {}
+		self._path_cache = {}
 		
-		most_recent_call_from_outside_self = [s.function in dir(self) for s in stack].index(False) - 1
-		if stack[most_recent_call_from_outside_self].function == '__init__':
-			most_recent_call_from_outside_self += 1
+		if not EDoc.TRACK_HISTORY:
+			self.caller_args = None
+			self.caller = None
+			return
 		
-		stack = stack[most_recent_call_from_outside_self]
-		caller_args = inspect.getargvalues(stack.frame)
+		# keep the history so we can recreate this object exactly
+		# but get it in an informative way that excludes the mostly internal functions.
+		# we walk the frames directly rather than using inspect.stack(),
+		# which also reads the source code for every frame
+		own_functions = set(dir(self))
+		previous_frame, frame = None, sys._getframe()
+		while frame.f_code.co_name in own_functions:
+			previous_frame, frame = frame, frame.f_back
+		
+		if previous_frame.f_code.co_name != '__init__':
+			frame = previous_frame
+		
+		caller_args = inspect.getargvalues(frame)
 		non_self_args = inspect.formatargvalues(*[arg if not arg == ['self'] else [] for arg in caller_args])
 		
 		self.caller_args = non_self_args
-		self.caller = stack.function
+		self.caller = frame.f_code.co_name
 			
 	def __repr__(self) -> str:
 		'''Returns a string representation of the EDoc.'''
@@ -676,16 +1149,16 @@ class EDoc():
 		Also allows for getting attributes by name.
 		'''
 		if isinstance(i, slice):
-			return [EToken(t) for t in self.doc[i]]
+			return [_wrap(t, self._etoken_cache) for t in self.doc[i]]
 		elif isinstance(i, int):
-			return EToken(self.doc[i])
+			return _wrap(self.doc[i], self._etoken_cache)
 		elif isinstance(i, str):
 			return getattr(self, i)
 	
 	def __iter__(self) -> EToken:
 		'''Iterates over tokens in the Doc.'''
 		for t in self.doc:
-			yield EToken(t)
+			yield _wrap(t, self._etoken_cache)
 	
 	def __unicode__(self) -> str:
 		'''Returns the text representation of the Doc.'''
@@ -714,7 +1187,7 @@ class EDoc():
 	def _history(self) -> str:
 		'''Get a string representation of the EDoc's history.'''
 		string = ''
-		if hasattr(self, 'caller'):
+		if getattr(self, 'caller', None) is not None:
 			if hasattr(self, 'previous') and self.previous is not None:
 				string += f'{self.previous._history}.'
 			
@@ -722,6 +1195,103 @@ class EDoc():
 		
 		return string
 	
+	@staticmethod
+	def _get_doc_attrs(tokens: List[Union[Token,EToken]]) -> Dict[str,List]:
+		'''
+		Get the attributes needed to construct a Doc
+		for each token, in a single pass over the tokens.
+		'''
+		words, spaces, tags, pos, morphs, lemmas = [], [], [], [], [], []
+		heads, deps, sent_starts = [], [], []
+		for t in tokens:
+			words.append(t.text)
+			spaces.append(t.whitespace_ == ' ')
+			tags.append(t.tag_)
+			pos.append(t.pos_)
+			# Doc only takes morphs as strings, and for spaCy tokens
+			# this is just a lookup of the morph's hash in the StringStore
+			morphs.append(str(t.morph))
+			lemmas.append(t.lemma_)
+			# for spaCy tokens, we mirror EToken.head_i,
+			# which treats the ROOT as its own head
+			if isinstance(t, EToken):
+				heads.append(t.head_i)
+			elif t.dep_ == 'ROOT':
+				heads.append(t.i)
+			else:
+				heads.append(t.head.i)
+			
+			deps.append(t.dep_)
+			sent_starts.append(t.is_sent_start)
+		
+		return dict(
+			words=words,
+			spaces=spaces,
+			tags=tags,
+			pos=pos,
+			morphs=morphs,
+			lemmas=lemmas,
+			heads=heads,
+			deps=deps,
+			sent_starts=sent_starts,
+		)
+	
+	def _copy_doc_array(self, keep: List[int] = None) -> Tuple[List[int],List[bool],'ndarray']:
+		'''
+		Get the words and spaces of the Doc's tokens, and
+		an array of their DOC_ARRAY_ATTRS. These are collected
+		once per EDoc, and each call gets new copies, with only the
+		tokens at the indices in keep if it is provided.
+		Words are orth ids, which Doc takes in place of strings.
+		'''
+		if self._doc_array is None:
+			self._doc_array = self.doc.to_array([ORTH, SPACY, *DOC_ARRAY_ATTRS])
+			
+			# we mirror EToken.head_i, which
+			# treats the ROOT as its own head
+			is_root = self._doc_array[:,2+DOC_ARRAY_DEP] == ROOT_DEP_ID
+			self._doc_array[is_root,2+DOC_ARRAY_HEAD] = 0
+		
+		array 	= self._doc_array if keep is None else self._doc_array[keep]
+		words 	= array[:,0].tolist()
+		spaces 	= [space == 1 for space in array[:,1].tolist()]
+		
+		return words, spaces, array[:,2:].copy()
+	
+	def _get_doc_array_row(self, t: Union[Token,EToken], i: int) -> List[int]:
+		'''
+		Get the values of DOC_ARRAY_ATTRS for a token
+		at index i in a new Doc, as Doc.__init__ would.
+		'''
+		strings = self.vocab.strings
+		head 	= t.head_i if isinstance(t, EToken) else t.head.i
+		
+		if t.is_sent_start is None:
+			sent_start = 0
+		else:
+			sent_start = 1 if t.is_sent_start else -1
+		
+		return [
+			strings.add(t.pos_),
+			(head - i) % UINT64_MOD,
+			strings.add(t.dep_),
+			strings.add(t.lemma_),
+			strings.add(t.tag_),
+			self.vocab.morphology.add(str(t.morph)),
+			sent_start % UINT64_MOD,
+		]
+	
+	def _doc_from_array(self, words: List[Union[int,str]], spaces: List[bool], array: 'ndarray') -> Doc:
+		'''Make a new Doc with the words and spaces, and the DOC_ARRAY_ATTRS in array.'''
+		doc = Doc(
+			vocab=self.vocab,
+			words=words,
+			spaces=spaces,
+			user_data=self.user_data,
+		)
+		
+		return doc.from_array(DOC_ARRAY_ATTRS, array)
+	
 	# Main thing of importance: allows editing by
 	# returning a new spaCy doc that is identical to
 	# the old one except with the tokens replaced.
@@ -743,48 +1313,17 @@ class EDoc():
 		if not len(tokens) == len(indices):
 			raise ValueError('There must be an equal number of tokens and indices!') 
 		
-		vocab 		= self.vocab
-		words 		= [t.text for t in self.doc]
-		spaces 		= [t.whitespace_ == ' ' for t in self.doc]
-		user_data	= self.user_data
-		tags 		= [t.tag_ for t in self.doc]
-		pos 		= [t.pos_ for t in self.doc]
-		morphs 		= [str(t.morph) for t in self.doc]
-		lemmas 		= [t.lemma_ for t in self.doc]
-		heads 		= [t.head.i if not hasattr(t, 'head_i') else t.head_i for t in self]
-		deps 		= [t.dep_ for t in self.doc]	
-		sent_starts = [t.is_sent_start for t in self.doc]
-		ents 		= [t.ent_iob_ for t in self.doc]
+		words, spaces, array = self._copy_doc_array()
 		
 		# replace the properties at each index with the properties from the updated tokens
 		for i, t in zip(indices, tokens):
-			words[i] 		= t.text
-			spaces[i]		= t.whitespace_
-			tags[i]			= t.tag_
-			pos[i]			= t.pos_
-			morphs[i]		= str(t.morph)
-			lemmas[i] 		= t.lemma_
-			heads[i]		= t.head.i if not hasattr(t, 'head_i') else t.head_i
-			deps[i]			= t.dep_
-			sent_starts[i] 	= t.is_sent_start
-			ents[i]			= t.ent_iob_
+			# the row needs the non-negative index for the relative head
+			i 			= range(len(words))[i]
+			words[i] 	= t.text
+			spaces[i] 	= t.whitespace_ == ' '
+			array[i] 	= self._get_doc_array_row(t, i)
 		
-		new_s = Doc(
-			vocab=vocab,
-			words=words,
-			spaces=spaces,
-			user_data=user_data,
-			tags=tags,
-			pos=pos,
-			morphs=morphs,
-			lemmas=lemmas,
-			heads=heads,
-			deps=deps,
-			sent_starts=sent_starts,
-			ents=ents,
-		)
-		
-		return EDoc(new_s, previous=self)
+		return EDoc(self._doc_from_array(words, spaces, array), previous=self)
 	
 	def _copy_with_remove(
 		self,
@@ -808,56 +1347,37 @@ class EDoc():
 				f'there is no token to remove at index >{len(self) - 1}!'
 			)
 		
-		tokens 		= [t for t in self.doc if not t.i in indices]
-		vocab 		= self.vocab
-		words 		= [t.text for t in tokens]
+		removed 	= set(indices)
+		kept 		= [i for i in range(len(self.doc)) if not i in removed]
+		words, spaces, array = self._copy_doc_array(kept)
 		
 		# if we removed the first token, capitalize the new first token
-		if not words[0][0].isupper():
-			words[0] = words[0][0].upper() + words[0][1:]
+		first = self.vocab.strings[words[0]]
+		if not first[0].isupper():
+			words[0] = first[0].upper() + first[1:]
 		
-		spaces = []
-		for t in tokens:
+		for j, i in enumerate(kept):
 			# if the removed token has no whitespace,
 			# we need to remove it from the token that 
 			# will now take its place
-			if t.i + 1 in indices:
-				spaces.append(self[t.i+1].whitespace_ == ' ')
-			else:
-				spaces.append(t.whitespace_ == ' ')
+			if i + 1 in removed:
+				spaces[j] = self.doc[i+1].whitespace_ == ' '
 		
-		user_data	= self.user_data
-		tags 		= [t.tag_ for t in tokens]
-		pos 		= [t.pos_ for t in tokens]
-		morphs 		= [str(t.morph) for t in tokens]
-		lemmas 		= [t.lemma_ for t in tokens]
-		heads 		= [t.head.i if not hasattr(t, 'head_i') else t.head_i for t in self if not t.i in indices]
+		# the array has relative heads, so get the original
+		# absolute heads of the tokens we keep first
+		heads = array[:,DOC_ARRAY_HEAD].view('int64') + kept
 		
-		# have to reduce the head indices for each index we remove
+		# have to reduce the head indices by the number of
+		# removed indices before them, and move the heads
+		# that were removed to the indices in move_deps_to
+		new_heads = heads - np.searchsorted(sorted(removed), heads)
 		for i, move_to in zip(indices, move_deps_to):
-			heads 	= [h - 1 if h > i else move_to if h == i else h for h in heads]
-		
-		deps 		= [t.dep_ for t in tokens]	
-		sent_starts = [t.is_sent_start for t in tokens]
-		sent_starts[0] = True # what if removing the first token?
-		ents 		= [t.ent_iob_ for t in tokens]
+			new_heads[heads == i] = move_to
 		
-		new_s = Doc(
-			vocab=vocab,
-			words=words,
-			spaces=spaces,
-			user_data=user_data,
-			tags=tags,
-			pos=pos,
-			morphs=morphs,
-			lemmas=lemmas,
-			heads=heads,
-			deps=deps,
-			sent_starts=sent_starts,
-			ents=ents
-		)
+		array[:,DOC_ARRAY_HEAD] = (new_heads - np.arange(len(kept))).view('uint64')
+		array[0,DOC_ARRAY_SENT_START] = 1 # what if removing the first token?
 		
-		return EDoc(new_s, previous=self)
+		return EDoc(self._doc_from_array(words, spaces, array), previous=self)
 	
 	def _copy_with_add(
 		self,
@@ -871,14 +1391,16 @@ class EDoc():
 		questions.
 		'''
 		tokens 		= self[:]
-		heads 		= [t.head.i if not hasattr(t, 'head_i') else t.head_i for t in tokens]
-		heads 		= [h + 1 if h > index else h for h in heads]
-		
 		tokens.insert(index, token)
-		heads.insert(index, token.head.i if not hasattr(token, 'head_i') else token.head_i)
+		attrs 		= self._get_doc_attrs(tokens)
 		
-		vocab 		= self.vocab
-		words 		= [t.text for t in tokens]
+		# shift the heads of the existing tokens past the added token
+		attrs['heads'] = [
+			h + 1 if h > index and j != index else h 
+			for j, h in enumerate(attrs['heads'])
+		]
+		
+		words 		= attrs['words']
 		
 		# if we have added to the beginning of the sentence
 		# we capitalize the token added and 
@@ -890,35 +1412,18 @@ class EDoc():
 		
 		# if we have added to a position preceding a no whitespace,
 		# remove the punctuation of the added token
-		if self[index].whitespace_ == '':
-			spaces 	= [t.whitespace_ == ' ' if t.i != index else False for t in tokens]
-		else:
-			spaces 	= [t.whitespace_ == ' ' for t in tokens]
-		
-		user_data	= self.user_data
-		tags 		= [t.tag_ for t in tokens]
-		pos 		= [t.pos_ for t in tokens]
-		morphs 		= [str(t.morph) for t in tokens]
-		lemmas 		= [t.lemma_ for t in tokens]
+		if self.doc[index].whitespace_ == '':
+			attrs['spaces'] = [
+				space if t.i != index else False 
+				for t, space in zip(tokens, attrs['spaces'])
+			]
 		
-		deps 		= [t.dep_ for t in tokens]
-		sent_starts = [t.is_sent_start for t in tokens]
-		sent_starts = [True] + [False for _ in range(len(tokens)-1)]
-		ents 		= [t.ent_iob_ for t in tokens]
+		attrs['sent_starts'] = [True] + [False for _ in range(len(tokens)-1)]
 		
 		new_s = Doc(
-			vocab=vocab,
-			words=words,
-			spaces=spaces,
-			user_data=user_data,
-			tags=tags,
-			pos=pos,
-			morphs=morphs,
-			lemmas=lemmas,
-			heads=heads,
-			deps=deps,
-			sent_starts=sent_starts,
-			ents=ents
+			vocab=self.vocab,
+			user_data=self.user_data,
+			**attrs,
 		)
 		
 		return EDoc(new_s, previous=self)
@@ -939,13 +1444,14 @@ class EDoc():
 		'''Is the main clause negative?'''
 		return self.polarity == 'Neg'
 	
-	@property
+	@cached_copied_property
 	def root(self) -> EToken:
 		'''Get the root node (i.e., main verb) of s.'''
-		try:
-			return [t for t in self if t.dep_ == 'ROOT'][0]
-		except IndexError:
-			return None
+		# find the root in the underlying doc so that
+		# we only wrap the token we need
+		for t in self.doc:
+			if t.dep == ROOT_DEP_ID:
+				return self[t.i]
 	
 	@property
 	def root_is_verb(self) -> bool:
@@ -958,21 +1464,23 @@ class EDoc():
 		else:
 			return False
 	
-	@property
+	@cached_copied_property
 	def main_verb(self) -> EToken:
 		'''Gets the tensed main verb.'''
 		if self.root_is_verb:
 			v = self.root
 			# in questions and/or passives, the root is the non-inflected verb, but we want the aux
 			# this also happens with stacked auxiliaries (i.e., would be, would have been, etc.)
-			while any(t for t in v.children if t.dep_ in ['auxpass', 'aux']):
-				v = [t for t in v.children if t.dep_ in ['auxpass', 'aux']][0]
+			aux = next((t for t in v.children if t.dep_ in AUX_DEPS), None)
+			while aux is not None:
+				v = aux
+				aux = next((t for t in v.children if t.dep_ in AUX_DEPS), None)
 			
 			return v
 		else:
 			return None
 	
-	@property
+	@cached_property
 	def main_verb_tense(self) -> str:
 		'''Gets the tense of the main verb.'''
 		v = self.main_verb
@@ -987,7 +1495,7 @@ class EDoc():
 		'''
 		return True if self.main_subject else False
 	
-	@property
+	@cached_copied_property
 	def main_subject(self) -> Union[EToken,List[EToken]]:
 		'''Gets the main clause subject of the SDoc if one exists.'''
 		v = self.main_verb
@@ -1003,8 +1511,7 @@ class EDoc():
 		
 		# now that we know we have something
 		# handle extensions and edge cases
-		if not isinstance(s,list):
-			s = [s]
+		s = listify(s)
 		
 		s.extend(self._get_conjuncts(s[0]))
 		
@@ -1013,7 +1520,7 @@ class EDoc():
 			# this is a weird bug spaCy has
 			# about hyphenated verbs
 			if s.text in VERB_PREFIXES:
-				s = [t for t in s.children if t.dep_ in SUBJ_DEPS.union({'compound'})]
+				s = [t for t in s.children if t.dep_ in SUBJ_OR_COMPOUND_DEPS]
 				s.extend(self._get_conjuncts(s[0]))
 				if len(s) == 1:
 					s = s[0]
@@ -1023,7 +1530,7 @@ class EDoc():
 		
 		return s
 	
-	@property
+	@cached_property
 	def main_subject_number(self) -> str:
 		'''Gets the number feature of the main clause subject.'''
 		s = self.main_subject
@@ -1034,12 +1541,12 @@ class EDoc():
 		else:
 			return self._get_noun_number(s)
 	
-	@property
+	@cached_property
 	def _main_subject_index(self) -> int:
 		'''What is the final index of the main subject?'''
 		s = self.main_subject
 		if isinstance(s, list):
-			s_loc = max([subj.i for subj in s]) + 1
+			s_loc = max(subj.i for subj in s) + 1
 		elif s is None:
 			s_loc = None
 		else:
@@ -1067,7 +1574,7 @@ class EDoc():
 		
 		return False
 	
-	@property
+	@cached_copied_property
 	def main_subject_determiner(self) -> Union[EToken,List[EToken]]:
 		'''Get the determiner(s) of the main subject.'''
 		s = self.main_subject
@@ -1078,128 +1585,119 @@ class EDoc():
 		
 		return d
 	
-	@property
+	@cached_copied_property
 	def main_subject_verb_interveners(self) -> List[EToken]:
 		'''
 		Get the tokens for the nouns that 
 		intervene between the head noun(s)
 		of the main subject and the main verb.
 		'''
-		s = self.main_subject
-		if not isinstance(s,list):
-			s = [s]
-		
+		return list(self._iter_main_subject_verb_interveners())
+	
+	def _iter_main_subject_verb_interveners(self) -> Iterator[EToken]:
+		'''
+		Yields the interveners between the main subject
+		and the main verb one at a time, so that callers
+		that only need to know whether there are any can stop
+		at the first one.
+		'''
+		s = listify(self.main_subject)
 		if any(t.text in ALL_PARTITIVES for t in s):
 			parts = [t for t in s if t.text in ALL_PARTITIVES]
 			s.extend(self._get_partitive_head_noun(part) for part in parts)
 			s = flatten(s)
 			
+			# s always has the partitive in it here
 			s_loc = max(t.i for t in s)
-			
-			if s_loc is None:
-				return []
 		else:
 			s_loc = self._main_subject_index
 			if s_loc is None:
-				return []
+				return
 		
 		# we only consider interveners
 		# that occur before the verb
 		# for now
 		v_loc = self.main_verb.i
 		if s_loc + 1 >= v_loc:
-			return []
-		
-		interveners = [t for t in self[s_loc+1:v_loc]]
-		if interveners:
-			interveners += [None]
-			# something is only really an intervener if
-			# (i)   it has a different tag from the next thing
-			# (ii)  it is a noun (NOUN or PROPN)
-			# (iii) it is not a direct child of the subject
-			# 		(which happens with compounds)
-			# (iv)	it is not part of a compound noun (since
-			# 		only the head of the compound should count)
-			# (v)	it is not the head of a partitive (whose
-			#		number features don't really count)
-			# we use the indices to check for children since
-			# the children generator returns a copy rather than
-			# a reference
-			interveners = [
-				t for i, t in enumerate(interveners[:-1])
-				if (
-					interveners[i+1] is None or
-					interveners[i+1].tag_ != t.tag_ and
-					interveners[i+1].pos_ != t.pos_
-				) and 
-				(
-					t.pos_ in ['NOUN', 'PROPN'] or 
-					(t.pos_ == 'PRON' and not t.text in RELATIVE_PRONOUNS)
-				) and
-				not t.dep_ in ['compound', 'nmod'] and 
-				not (
-					(
-						t.text in PARTITIVES_WITH_P.union(PARTITIVES_OPTIONAL_P) and
-						any(word.text in PARTITIVES_P_MAP.get(word.text, ['of']) for word in t.children)
-					) and 
-					(
-						t.text in PARTITIVES_WITH_INDEFINITE_ONLY and
-						t.determiner and 
-						isinstance(t.determiner,list) and 
-						not any(word.get_morph('Definite') == 'Ind' for word in t.determiner)
-					) and 
-					(
-						t.text in PARTITIVES_WITH_INDEFINITE_ONLY and
-						t.determiner and 
-						not isinstance(t.determiner,list) and 
-						not t.determiner.get_morph('Definite') == 'Ind'
-					) and 
-					(
-						t.text in PARTITIVES_OPTIONAL_P and 
-						any(t.children)
-					)
-				)
-			]
-		
-		return interveners
+			return
+		
+		# something is only really an intervener if
+		# (i)   it has a different tag from the next thing
+		# (ii)  it is a noun (NOUN or PROPN)
+		# (iii) it is not a direct child of the subject
+		# 		(which happens with compounds)
+		# (iv)	it is not part of a compound noun (since
+		# 		only the head of the compound should count)
+		# we use the indices to check for children since
+		# the children generator returns a copy rather than
+		# a reference
+		# we check the cheapest conditions first,
+		# on the spaCy tokens, so that we only make
+		# ETokens for the ones that pass. ETokens have the
+		# same tags and deps, and only correct the pos of
+		# words in INCORRECT_POS
+		doc = self.doc
+		for i in range(s_loc+1, v_loc):
+			t 	= doc[i]
+			pos = INCORRECT_POS.get(t.text, t.pos_)
+			if not (
+				pos in LEXICAL_NOUN_POS_TAGS or 
+				(pos == 'PRON' and not t.text in RELATIVE_PRONOUNS)
+			):
+				continue
+			
+			if t.dep_ in COMPOUND_DEPS:
+				continue
+			
+			# the last intervener has nothing after it,
+			# so it is always different from the next thing
+			nxt = doc[i+1] if i + 1 < v_loc else None
+			if nxt is not None and (nxt.tag_ == t.tag_ or INCORRECT_POS.get(nxt.text, nxt.pos_) == pos):
+				continue
+			
+			# partitive heads are deliberately kept, since the old check for them could never be true
+			yield self[i]
 	
 	@property
 	def has_main_subject_verb_interveners(self) -> bool:
 		'''Do any nouns come between the main subject and its verb?'''
-		return any(self.main_subject_verb_interveners)
+		return next(self._iter_main_subject_verb_interveners(), None) is not None
 	
-	@property
-	def main_subject_verb_intervener_structures(self) -> List[str]:
-		'''What structure is each intervener embedded in?'''
+	def _structures_for(self, d: List[EToken]) -> List[str]:
+		'''
+		What structure is each token in d embedded in,
+		relative to the (final) head of the main subject?
+		'''
+		if not d:
+			return None
+		
 		s = self.main_subject
 		if isinstance(s,list):
 			s = s[-1]
 		
-		d = self.main_subject_verb_interveners
-		
-		if d:
-			d_dep_seqs = []
-			for intervener in d:
-				path = self._get_path(fr=intervener, to=s)
-				path = [t for t in path if not t.i == s.i]
-				if path:
-					d_dep_seqs.append(list(dict.fromkeys([STRUCTURE_MAP.get(t.dep_, t.dep_) for t in path])))
-				else:
-					path = self._get_path(fr=intervener, to=self.root)[:-1]
-					d_dep_seqs.append(list(dict.fromkeys([STRUCTURE_MAP.get(t.dep_, t.dep_) for t in path])))
-			
-			d_dep_seqs = [
-				[dep for dep in dep_seq if not dep in EXCLUDE_DEPS]
-				for dep_seq in d_dep_seqs
-			]
+		d_dep_seqs = []
+		for intervener in d:
+			path = self._get_path(fr=intervener, to=s)
+			path = [t for t in path if not t.i == s.i]
+			if not path:
+				path = self._get_path(fr=intervener, to=self.root)[:-1]
 			
-			d_dep_seqs = [
-				','.join(list(dict.fromkeys(dep_seq)))
-				for dep_seq in d_dep_seqs
-					if len(dep_seq) > 0
+			# removing the excluded deps keeps the rest unique
+			dep_seq = [
+				dep 
+				for dep in dict.fromkeys(STRUCTURE_MAP.get(t.dep_, t.dep_) for t in path)
+					if not dep in EXCLUDE_DEPS
 			]
 			
-			return d_dep_seqs
+			if dep_seq:
+				d_dep_seqs.append(','.join(dep_seq))
+		
+		return d_dep_seqs
+	
+	@cached_copied_property
+	def main_subject_verb_intervener_structures(self) -> List[str]:
+		'''What structure is each intervener embedded in?'''
+		return self._structures_for(self.main_subject_verb_interveners)
 	
 	@property
 	def main_subject_verb_final_intervener_structure(self) -> str:
@@ -1208,7 +1706,7 @@ class EDoc():
 		if d:
 			return d[-1]
 	
-	@property
+	@cached_copied_property
 	def main_subject_verb_distractors(self) -> List[EToken]:
 		'''
 		Get the tokens for the interveners
@@ -1219,49 +1717,25 @@ class EDoc():
 		that occur after the subject head noun
 		(i.e., not on Wagers et al. 2009) structures).
 		'''
-		n 			= self.main_subject_number
-		interveners = self.main_subject_verb_interveners
+		return list(self._iter_main_subject_verb_distractors())
+	
+	def _iter_main_subject_verb_distractors(self) -> Iterator[EToken]:
+		'''Yields the distractors one at a time.'''
+		n = self.main_subject_number
 		# assume singular if the morph for number doesn't exist
-		distractors = [t for t in interveners if (t.get_morph('Number') or 'Sing') != n]
-		return distractors
+		for t in self._iter_main_subject_verb_interveners():
+			if (t.get_morph('Number') or 'Sing') != n:
+				yield t
 	
 	@property
 	def has_main_subject_verb_distractors(self) -> bool:
 		'''Are there any distractors between the main clause subject and the main clause verb?'''
-		return any(self.main_subject_verb_distractors)
+		return next(self._iter_main_subject_verb_distractors(), None) is not None
 	
-	@property
+	@cached_copied_property
 	def main_subject_verb_distractor_structures(self) -> List[str]:
 		'''What structure is each distractor embedded in?'''
-		s = self.main_subject
-		if isinstance(s,list):
-			s = s[-1]
-		
-		d = self.main_subject_verb_distractors
-		
-		if d:
-			d_dep_seqs = []
-			for intervener in d:
-				path = self._get_path(fr=intervener, to=s)
-				path = [t for t in path if not t.i == s.i]
-				if path:
-					d_dep_seqs.append(list(dict.fromkeys([STRUCTURE_MAP.get(t.dep_, t.dep_) for t in path])))
-				else:
-					path = self._get_path(fr=intervener, to=self.root)[:-1]
-					d_dep_seqs.append(list(dict.fromkeys([STRUCTURE_MAP.get(t.dep_, t.dep_) for t in path])))
-			
-			d_dep_seqs = [
-				[dep for dep in dep_seq if not dep in EXCLUDE_DEPS]
-				for dep_seq in d_dep_seqs
-			]
-			
-			d_dep_seqs = [
-				','.join(list(dict.fromkeys(dep_seq))) 
-				for dep_seq in d_dep_seqs
-					if len(dep_seq) > 0
-			]
-			
-			return d_dep_seqs
+		return self._structures_for(self.main_subject_verb_distractors)
 	
 	@property
 	def main_subject_verb_final_distractor_structure(self) -> str:
@@ -1270,7 +1744,7 @@ class EDoc():
 		if d:
 			return d[-1]	
 	
-	@property
+	@cached_copied_property
 	def main_subject_verb_distractors_determiners(self) -> List[EToken]:
 		'''
 		Get the determiners for the interveners
@@ -1281,21 +1755,15 @@ class EDoc():
 		that occur after the subject head noun
 		(i.e., not on Wagers et al. 2009) structures).
 		'''
-		n 			= self.main_subject_number
-		interveners = self.main_subject_verb_interveners
-		distractors = [t for t in interveners if t.get_morph('Number') != n]
-		distractors_d = [t for d in distractors for t in d.children if d.dep_ == 'det']
-		return distractors_d
+		return [c for d in self.main_subject_verb_distractors for c in d.children if c.dep_ == 'det']
 	
-	@property
+	@cached_copied_property
 	def main_object(self) -> Union[EToken,List[EToken]]:
 		v = self.main_verb
 		s = v.object
 		
 		if s is not None:
-			if not isinstance(s,list):
-				s = [s]
-			
+			s = listify(s)
 			s.extend(self._get_conjuncts(t) for t in s[:])
 			s = flatten(s)
 			
@@ -1307,7 +1775,7 @@ class EDoc():
 			
 			return s
 	
-	@property
+	@cached_copied_property
 	def main_object_determiner(self) -> Union[EToken,List[EToken]]:
 		'''Get the determiner(s) of the main object.'''
 		o = self.main_object
@@ -1318,7 +1786,7 @@ class EDoc():
 		
 		return d
 	
-	@property
+	@cached_property
 	def main_object_number(self) -> str:
 		'''
 		What is the number of the main object of the verb?
@@ -1336,7 +1804,9 @@ class EDoc():
 	@property
 	def has_main_object(self) -> bool:
 		'''Does the sentence have an object of the main verb?'''
-		return True if self.main_object else False
+		# conjuncts only ever extend the main object,
+		# so we don't need to build the full list
+		return self.main_verb.object is not None
 	
 	@property
 	def is_transitive(self) -> bool:
@@ -1348,40 +1818,54 @@ class EDoc():
 		'''Is the sentence('s main verb) intransitive?'''
 		return not self.is_transitive
 	
-	@property
+	@cached_copied_property
 	def pos_seq(self) -> List[str]:
 		'''Get the part of speech sequence of the sentence.'''
-		return [t.pos_ for t in self] 
+		# read these directly from the Doc instead of
+		# casting every token to EToken, and fix the
+		# parts of speech the way EToken does
+		strings = self.vocab.strings
+		return [
+			INCORRECT_POS.get(strings[orth], strings[pos])
+			for orth, pos in self.doc.to_array([ORTH, POS]).tolist()
+		]
 	
-	@property
+	@cached_copied_property
 	def tag_seq(self) -> List[str]:
 		'''Get the tag sequence of the sentence.'''
-		return [t.tag_ for t in self]
+		strings = self.vocab.strings
+		return [strings[tag] for tag in self.doc.to_array(TAG).tolist()]
 	
-	@property
+	@cached_copied_property
 	def main_clause_verbs(self) -> List[EToken]:
 		'''Get all the verbs in the main clause of the sentence.'''
 		v = self.main_verb
 		vs = [v] + [t for t in self._get_conjuncts(v) if t.is_aux or t.is_verb]
-		if self.main_verb.is_aux:
+		if v.is_aux:
 			vs = vs + self._get_conjuncts(self.root)
 		
+		# add the conjuncts of each verb, skipping
+		# verbs we already have so that each is only
+		# expanded once
+		seen = {t.i for t in vs}
 		for v in vs:
-			vs.extend([t for t in self._get_conjuncts(v) if t.is_aux or t.is_verb])
-		
-		for i, v in enumerate(vs):
-			if any(t for t in v.children if t.dep_ in ['aux', 'auxpass']):
-				vs[i] = [t for t in v.children if t.dep_ in ['aux', 'auxpass']][0]
-		
-		# remove any duplicates by indices
-		unique_indices = set(t.i for t in vs)
-		deduped_vs = []
-		for i in unique_indices:
-			verbs = [t for t in vs if t.i == i and (t.is_aux or t.is_verb)]
-			if verbs and not any(t.i == i for t in deduped_vs):
-				deduped_vs.append(verbs[0])
+			for t in self._get_conjuncts(v):
+				if (t.is_aux or t.is_verb) and not t.i in seen:
+					seen.add(t.i)
+					vs.append(t)
+		
+		# use the aux for verbs that have one,
+		# and remove any duplicates by indices
+		deduped_vs = {}
+		for v in vs:
+			aux = next((t for t in v.children if t.dep_ in AUX_DEPS), None)
+			if aux is not None:
+				v = aux
+			
+			if (v.is_aux or v.is_verb) and not v.i in deduped_vs:
+				deduped_vs[v.i] = v
 		
-		vs = sorted(deduped_vs, key = lambda t: t.i)
+		vs = sorted(deduped_vs.values(), key = lambda t: t.i)
 		# we could also technically add 'VBN' here, since those are also
 		# non-finite. however, spaCy frequently misparses conjoined main
 		# verbs as VBNs, so we want to include them. if we're making
@@ -1391,6 +1875,14 @@ class EDoc():
 		
 		return vs
 		
+	@cached_property
+	def _main_clause_verb_tenses(self) -> Tuple[str]:
+		'''
+		The tense of each main clause verb. This lets us check
+		the tenses without copying the verbs each time.
+		'''
+		return tuple(v.get_morph('Tense') for v in self.main_clause_verbs)
+	
 	@property
 	def can_form_polar_question(self) -> bool:
 		'''Can the sentence form a polar question?'''
@@ -1398,7 +1890,7 @@ class EDoc():
 		# can only make questions from sentences 
 		# that aren't already questions
 		# and are parsed correctly
-		if not self[-1].text in ['.', '!'] or self[-1].dep_ != 'punct':
+		if not self[-1].text in DECLARATIVE_FINAL_PUNCT or self[-1].dep_ != 'punct':
 			return False
 		
 		vs = self.main_clause_verbs
@@ -1419,76 +1911,40 @@ class EDoc():
 		ss = []
 		for v in vs:
 			s = v.subject
-			if s and self._can_be_inverted_subject(s, v):
-				ss.append(s)
-			elif s and not self._can_be_inverted_subject(s, v):
-				return False
+			if s:
+				if not self._can_be_inverted_subject(s, v):
+					return False
 			else:
-				next_v = v
-				limit = 0
-				while not next_v.subject:
-					next_v = next_v.head
-					# we've reached the root but still haven't found
-					# a subject, so break
-					if next_v.dep_ == 'ROOT':
-						return False
-					
-					limit += 1
-					if limit > LOOK_FOR_SUBJECTS_LIMIT:
-						log.warn(
-							f'Could not find a subject for "{v}" in "{self}" '
-							f'within {LOOK_FOR_SUBJECTS_LIMIT}!'
-						)
-						return False
-				
-				if self._can_be_inverted_subject(next_v.subject, next_v):
-					ss.append(next_v.subject)
-				else:
+				next_v, s = self._find_subject_bearer(v)
+				if next_v is None or not self._can_be_inverted_subject(s, next_v):
 					return False
+			
+			ss.append(s)
 		
-		ss = flatten(ss)
-		ds = flatten([s.determiner for s in ss if s.determiner is not None])
-		if any(s.text == 'which' for s in ss + ds):
-			return False
-		
-		# misparses
-		if any(t.get_morph('VerbForm') == 'Inf' for t in vs):
+		flat_ss = flatten(ss)
+		ds = flatten([s.determiner for s in flat_ss if s.determiner is not None])
+		if any(s.text == 'which' for s in flat_ss + ds):
 			return False
 		
-		# sometimes spaCy identifies a non-finite verb
-		# as a main clause verb, due to misparsing
-		# if the sentence is misparsed, we won't be able
-		# to make a question out of it reliably
-		if any(not t.can_be_inflected for t in vs if not t.is_aux):
-			# cannot_be_inflected = [t for t in vs if not t.can_be_inflected and t.tag_ == 'VBN']
-			# log.info(
-			# 	f'"{self}" cannot be made into a polar question because it contains '
-			# 	f'non-finite main clause verb(s): "{",".join([t.text for t in cannot_be_inflected])}" '
-			# 	f'({",".join([t.tag_ for t in cannot_be_inflected])})! '
-			# 	f'This is probably because it is ungrammatical or was parsed incorrectly.'
-			# )
-			return False
+		for t in vs:
+			# misparses
+			if t.get_morph('VerbForm') == 'Inf':
+				return False
+			
+			# sometimes spaCy identifies a non-finite verb
+			# as a main clause verb, due to misparsing
+			# if the sentence is misparsed, we won't be able
+			# to make a question out of it reliably
+			if not t.is_aux and not t.can_be_inflected:
+				return False
 		
 		# we need to make sure that all of the main clause
 		# verbs that share a subject would use the same auxiliary
 		# to form a question
 		all_v_lemmas = {}
-		for v in vs:
-			# run up the tree until we find the verb's subject
-			tmp_v = v
-			limit = 0
-			while not tmp_v.subject:
-				tmp_v = tmp_v.head
-				limit += 1
-				if limit > LOOK_FOR_SUBJECTS_LIMIT:
-					log.warn(
-						f'Could not find a subject for "{v}" in "{self}" '
-						f'within {LOOK_FOR_SUBJECTS_LIMIT}!'
-					)
-					return False
-			
-			# get the first subject position for that verb
-			tmp_subject = tmp_v.subject
+		for v, tmp_subject in zip(vs, ss):
+			# get the first subject position for that verb.
+			# we found the verb's subject above
 			if isinstance(tmp_subject,list):
 				tmp_subject = sorted(tmp_subject, key=lambda t: t.i)[0]
 			
@@ -1516,6 +1972,34 @@ class EDoc():
 		
 		return True
 	
+	def _find_subject_bearer(self, v: EToken) -> Tuple[EToken,Union[EToken,List[EToken]]]:
+		'''
+		Run up the tree from v until we find a token with a subject.
+		Returns that token and its subject, or (None, None) if we
+		reach the root or go past LOOK_FOR_SUBJECTS_LIMIT first.
+		'''
+		next_v = v
+		limit = 0
+		s = next_v.subject
+		while not s:
+			next_v = next_v.head
+			# we've reached the root but still haven't found
+			# a subject, so break
+			if next_v.dep_ == 'ROOT':
+				return None, None
+			
+			limit += 1
+			if limit > LOOK_FOR_SUBJECTS_LIMIT:
+				log.warn(
+					f'Could not find a subject for "{v}" in "{self}" '
+					f'within {LOOK_FOR_SUBJECTS_LIMIT}!'
+				)
+				return None, None
+			
+			s = next_v.subject
+		
+		return next_v, s
+	
 	def _get_partitive_head_noun(self, t: Union[Token,EToken]) -> Union[EToken,List[EToken]]:
 		'''Get the head noun of a partitive.'''
 		if not t.text in ALL_PARTITIVES:
@@ -1584,7 +2068,13 @@ class EDoc():
 	
 	def _get_conjuncts(self, t: Union[Token,EToken]) -> List[EToken]:
 		'''Returns all conjuncts dependent on the first in a coordinated phrase.'''
-		conjuncts = [t for t in t.rights if t.dep_ == 'conj']
+		# the conjuncts only depend on the underlying token,
+		# so we can reuse them for tokens from this Doc
+		key = t._token.i if isinstance(t, EToken) and t._cache is self._etoken_cache else None
+		if key in self._conjuncts_cache:
+			return _copy_etokens(self._conjuncts_cache[key])
+		
+		conjuncts = [r for r in t.rights if r.dep_ == 'conj']
 		for i, c in enumerate(conjuncts[:]):
 			if c.text in ALL_PARTITIVES:
 				# the next line addresses cases when spaCy parses the
@@ -1595,12 +2085,17 @@ class EDoc():
 		
 		conjuncts = flatten(conjuncts)
 		
+		# add the conjuncts of each conjunct,
+		# skipping any we already have
+		seen = {c.i for c in conjuncts}
 		for c in conjuncts[:]:
-			conjuncts.extend(
-				t 
-				for t in self._get_conjuncts(c) 
-					if not any(t.i == t2.i for t2 in conjuncts)
-			)
+			for c2 in self._get_conjuncts(c):
+				if not c2.i in seen:
+					seen.add(c2.i)
+					conjuncts.append(c2)
+		
+		if key is not None:
+			self._conjuncts_cache[key] = _copy_etokens(conjuncts)
 		
 		return conjuncts
 	
@@ -1617,8 +2112,8 @@ class EDoc():
 			# gerunds and nominal verbs are grammatically singular
 			return 'Sing'
 		elif (
-			s.dep_ in ['csubj', 'csubjpass'] or 
-			(s.dep_ in OBJ_DEPS and s.tag_ in ['WP', 'WD', 'WDT'])
+			s.dep_ in CLAUSAL_SUBJ_DEPS or 
+			(s.dep_ in OBJ_DEPS and s.tag_ in SUBJ_EXCL_TAGS)
 		):	# clausal subjects/object are not correctly associated
 			# with a Singular number feature
 			return 'Sing'
@@ -1631,37 +2126,45 @@ class EDoc():
 		elif s.text in ALL_PARTITIVES:
 			# special logic here, so a separate function
 			return self._get_partitive_noun_number(s)
-		elif (
-			s.determiner and
-			isinstance(s.determiner,list) and
-			any(t for t in s.determiner if t.tag_ in DET_TAGS) and
-			[t for t in s.determiner if t.tag_ in DET_TAGS][0].get_morph('Number') and
-			not [t for t in s.determiner if t.tag_ in DET_TAGS][0] in ALL_PARTITIVES
+		
+		# the determiner is found and copied on every access,
+		# so we only get it once for the checks below
+		d = s.determiner
+		if isinstance(d,list):
+			# the first determiner with a determiner tag
+			det_d = next((t for t in d if t.tag_ in DET_TAGS), None)
+		
+		if (
+			d and
+			isinstance(d,list) and
+			det_d is not None and
+			det_d.get_morph('Number') and
+			not det_d in ALL_PARTITIVES
 		):	# this happens with "all the ...", which tags 'all' as 'PDT'
 			# we also want to account for single cases of 'all ...', where it is partitive,
 			# so don't use a determiner if it is a partitive, even if it has a number feature
 			# in this case, we want to treat all as a partitive and NOT use its number
 			# as the number of the subject
-			return [t for t in s.determiner if t.tag_ in DET_TAGS][0].get_morph('Number')
+			return det_d.get_morph('Number')
 		elif (
-			s.determiner and 
-			not isinstance(s.determiner,list) and 
-			s.determiner.get_morph('Number') and 
-			s.determiner.tag_ in DET_TAGS and 
-			not s.determiner.text in ALL_PARTITIVES
+			d and 
+			not isinstance(d,list) and 
+			d.get_morph('Number') and 
+			d.tag_ in DET_TAGS and 
+			not d.text in ALL_PARTITIVES
 		):	# if there is a helpful determiner that isn't a list
 			# that has a number feature (i.e., 'these')
 			# and it isn't a partitive (since some partitives
 			# have default number features, which shouldn't override
 			# the noun's number)
-			return s.determiner.get_morph('Number')
+			return d.get_morph('Number')
 		elif (
 			s.text in PLURALS_WITH_NO_DETERMINERS and 
 			(
-				not s.determiner or 
+				not d or 
 				(
-					not isinstance(s.determiner,list) and 
-					s.determiner.text == 'all'
+					not isinstance(d,list) and 
+					d.text == 'all'
 				)
 			)
 		):	# some nouns have the same singular and plural forms
@@ -1715,7 +2218,7 @@ class EDoc():
 				d = [d] if d is not None else []
 			
 			if (
-				s.text in ['number'] and 
+				s.text == 'number' and 
 				any(t.get_morph('Definite') == 'Ind' for t in d) and
 				any(t.text in PARTITIVES_P_MAP.get(t.text, ['of']) for t in s.children)
 			):
@@ -1735,7 +2238,7 @@ class EDoc():
 				return 'Plur'
 			elif s.get_morph('Number'):
 				return s.get_morph('Number')
-			elif s.text in ['Some', 'some', 'Any', 'any']:
+			elif s.text in SOME_ANY:
 				# we end up here if we have 'some' as a subject
 				# of a copular sentence. like "some were discarded buses,
 				# rais carriages."
@@ -1796,7 +2299,9 @@ class EDoc():
 		if len(s) == 1:
 			return self._get_noun_number(s[0])
 		
-		tag_counts = Counter([t.dep_ for t in s])
+		# we need the count of each dep separately,
+		# since we check for exactly one of a given dep
+		tag_counts = Counter(t.dep_ for t in s)
 		# happens with some dummy 'it' subject sentences
 		# and some copular sentences
 		# one subject and one attr
@@ -1804,7 +2309,7 @@ class EDoc():
 			nums = [t.get_morph('Number') if not (t.is_verb and t.can_be_inflected) else 'Sing' for t in s]
 			# if all the subjects are singular and we have one attr
 			# and one nsubj, then the subject is singular
-			if all([n == 'Sing' for n in nums]):
+			if all(n == 'Sing' for n in nums):
 				return 'Sing'
 			# this happens in weird cases like
 			# "the best thing were the movies we watched..."
@@ -1817,15 +2322,17 @@ class EDoc():
 				# we only trust the verb number if we have a subject noun
 				# since objects don't agree
 				if deps == SUBJ_DEPS:
-					if self.main_verb.get_morph('Number'):
-						return self.main_verb.get_morph('Number')
+					verb_number = self.main_verb.get_morph('Number')
+					if verb_number:
+						return verb_number
 					
 				if s[0].text in ALL_PARTITIVES:
 					return self._get_partitive_noun_number(s[0])
 				
 				for subj in s:
-					if subj.get_morph('Number'):
-						return subj.get_morph('Number')
+					subj_number = subj.get_morph('Number')
+					if subj_number:
+						return subj_number
 				else:
 					log.warning(
 						f'No token in "{s}" has a number feature! ({self}) '
@@ -1850,21 +2357,45 @@ class EDoc():
 		Get the dependency path linking two (E)Tokens.
 		If no path exists, return an empty list.
 		'''
-		path = [fr]
 		if fr.i == to.i:
-			return path		
-		elif fr.head.i == to.i:
-			path.append(to)
-			return path
-		elif fr.head.i == fr.i:
+			return [fr]
+		
+		head = fr.head
+		if head.i == to.i:
+			return [fr, to]
+		elif head.i == fr.i:
 			return []
-		else:
-			ext_path = self._get_path(fr.head, to)
-			if ext_path is None:
-				return []
-			else:
-				path.extend(ext_path)
-				return path
+		
+		# paths from the same head in this Doc are the same,
+		# so we only need to find the rest of each one once
+		key = (head.i, to.i)
+		cacheable = isinstance(head, EToken) and head._cache is self._etoken_cache
+		if cacheable and key in self._path_cache:
+			return [fr] + _copy_etokens(self._path_cache[key])
+		
+		# go up the heads until we reach to or the root.
+		# if we reach the root, the path stops before it
+		ext_path = []
+		t = head
+		while True:
+			if t.i == to.i:
+				ext_path.append(t)
+				break
+			
+			head = t.head
+			if head.i == to.i:
+				ext_path.extend([t, to])
+				break
+			elif head.i == t.i:
+				break
+			
+			ext_path.append(t)
+			t = head
+		
+		if cacheable:
+			self._path_cache[key] = _copy_etokens(ext_path)
+		
+		return [fr] + ext_path
 	
 	# CONVENIENCE METHODS.
 	# These return new objects; they do NOT modify in-place.
@@ -1912,8 +2443,8 @@ class EDoc():
 		if any(
 			v.lemma_ == 'do' and 								# did
 			v.is_aux and 										# Q
-			v.head.text in ['use', 'used'] and					# used/use
-			any(t.dep_ == 'xcomp' for t in v.head.children) and	# to
+			v.head.text in USE_TO_FORMS and					# used/use
+			v.head._has_child_with_dep(XCOMP_DEP_ID) and		# to
 			tense == PRESENT									# cannot make present tense
 			for v in all_vs
 		):
@@ -1925,14 +2456,18 @@ class EDoc():
 		# this will allow us to account for contractions
 		whitespaces_modified = []
 		
+		mapped_number 	= NUMBER_MAP[number]
+		mapped_tense 	= TENSE_MAP[tense]
+		
 		for v in all_vs:
 			if not (
-				(TENSE_MAP.get(v.get_morph('Tense')) == TENSE_MAP[tense]) and
-				(NUMBER_MAP.get(v.get_morph('Number')) == NUMBER_MAP[number])
+				(TENSE_MAP.get(v.get_morph('Tense')) == mapped_tense) and
+				(NUMBER_MAP.get(v.get_morph('Number')) == mapped_number)
 			):
 				# handle contractions
 				starts_with_apostrophe = v.text.startswith("'")
-				if (v.text in HOMOPHONOUS_VERBS and HOMOPHONOUS_VERBS[v.text]['condition'](v)):
+				homophones = HOMOPHONOUS_VERBS.get(v.text)
+				if homophones is not None and homophones['condition'](v):
 					if any(kwargs.keys()):
 						log.warning(
 							f'{v.text} is homophonous to another verb. ' 
@@ -1941,8 +2476,8 @@ class EDoc():
 							 'though they will be added to the morphology.'
 						)
 					
-					m_number = 'Sing' if NUMBER_MAP.get(number) == SG else 'Plur'
-					m_tense  = 'Pres' if TENSE_MAP.get(tense) == PRESENT else 'Past'
+					m_number = 'Sing' if mapped_number == SG else 'Plur'
+					m_tense  = 'Pres' if mapped_tense == PRESENT else 'Past'
 					
 					d_number = 'singular' if number == 'Sing' else 'plural'
 					d_tense = 'present' if tense == PRESENT else 'past'
@@ -1950,11 +2485,14 @@ class EDoc():
 					morph_kwargs = {'Number': m_number, 'Tense': m_tense, **kwargs}
 					morph_kwargs = {k: v for k, v in morph_kwargs.items() if v is not None}
 					
-					if HOMOPHONOUS_VERBS[v.text].get(d_number, {}).get(d_tense, {}):
-						v.text = HOMOPHONOUS_VERBS[v.text][d_number][d_tense]
-						v.set_morph(**morph_kwargs)
-					elif HOMOPHONOUS_VERBS[v.text].get('any', {}).get(d_tense, {}):
-						v.text = HOMOPHONOUS_VERBS[v.text]['any'][d_tense]
+					# use the form for the specific number if there is one,
+					# and the form for any number otherwise
+					text = (
+						HOMOPHONOUS_VERB_FORMS.get((v.text, d_number, d_tense)) or
+						HOMOPHONOUS_VERB_FORMS.get((v.text, 'any', d_tense))
+					)
+					if text:
+						v.text = text
 						v.set_morph(**morph_kwargs)
 					else:
 						v.reinflect(number, tense, **kwargs)
@@ -1972,9 +2510,7 @@ class EDoc():
 	
 	def make_main_verb_past_tense(self) -> 'EDoc':
 		'''Convert the main verb to past tense.'''
-		vs = self.main_clause_verbs
-		
-		if all(v.get_morph('Tense') == 'Past' for v in vs):
+		if all(tense == 'Past' for tense in self._main_clause_verb_tenses):
 			return self
 		
 		n = self.main_subject_number
@@ -1982,9 +2518,7 @@ class EDoc():
 	
 	def make_main_verb_present_tense(self) -> 'EDoc':
 		'''Convert the main verb to present tense.'''
-		vs = self.main_clause_verbs
-		
-		if all(v.get_morph('Tense') == 'Pres' for v in vs):
+		if all(tense == 'Pres' for tense in self._main_clause_verb_tenses):
 			return self
 		
 		n = self.main_subject_number
@@ -1992,29 +2526,25 @@ class EDoc():
 	
 	def singularize_main_verb(self, conjoined: bool = True) -> 'EDoc':
 		'''Convert the main verb to singular form.'''
-		vs = self.main_clause_verbs
-		
 		# only 'be' can be numbered in the past tense
 		if (
-			all(v.get_morph('Tense') == 'Past' for v in vs) and
-			not any(v.lemma_ == 'be' for v in vs)
+			all(tense == 'Past' for tense in self._main_clause_verb_tenses) and
+			not any(v.lemma_ == 'be' for v in self.main_clause_verbs)
 		):
 			return self
 		
-		return self.reinflect_main_verb(number='Sing', tense=self.main_verb.get_morph('Tense'), conjoined=conjoined)
+		return self.reinflect_main_verb(number='Sing', tense=self.main_verb_tense, conjoined=conjoined)
 	
 	def pluralize_main_verb(self, conjoined: bool = True) -> 'EDoc':
 		'''Convert the main verb to plural form.'''
-		vs = self.main_clause_verbs
-		
 		# only 'be' can be numbered in the past tense
 		if (
-			all(v.get_morph('Tense') == 'Past' for v in vs) and
-			not any(v.lemma_ == 'be' for v in vs)
+			all(tense == 'Past' for tense in self._main_clause_verb_tenses) and
+			not any(v.lemma_ == 'be' for v in self.main_clause_verbs)
 		):
 			return self
 		
-		return self.reinflect_main_verb(number='Plur', tense=self.main_verb.get_morph('Tense'), conjoined=conjoined)
+		return self.reinflect_main_verb(number='Plur', tense=self.main_verb_tense, conjoined=conjoined)
 	
 	def renumber_main_subject(self, number: str) -> 'EDoc':
 		'''Renumber the main subject, along with its determiner and verb.'''
@@ -2033,26 +2563,18 @@ class EDoc():
 		
 		tokens = []
 		
-		s = edoc.main_subject
-		# at this point, it's because we have a copular sentence,
-		# so renumber all args. conjunctions were removed above
-		if isinstance(s,list):
-			for t in s:
-				t.renumber(number=number)
-				tokens.append(t)
-		else:
-			s.renumber(number=number)
-			tokens.append(s)
+		# if the subject is a list at this point, it's because we
+		# have a copular sentence, so renumber all args.
+		# conjunctions were removed above
+		for t in listify(edoc.main_subject):
+			t.renumber(number=number)
+			tokens.append(t)
 		
 		d = edoc.main_subject_determiner
 		if d:
-			if isinstance(d,list):
-				for t in d:
-					t.renumber(number=number)
-					tokens.append(t)
-			else:
-				d.renumber(number=number)
-				tokens.append(d)
+			for t in listify(d):
+				t.renumber(number=number)
+				tokens.append(t)
 		
 		v = edoc.main_verb
 		v.reinflect(number=number)
@@ -2075,7 +2597,7 @@ class EDoc():
 		starting_index 	= s[0].i
 		
 		# until this position
-		remove_until 	= max([t.i for t in s[1:]])
+		remove_until 	= max(t.i for t in s[1:])
 		
 		# remove from one after the head of the conjP
 		# until the final position to remove (range() is [x,y))
@@ -2132,20 +2654,21 @@ class EDoc():
 		return self.renumber_main_subject(number=PL)
 	
 	def renumber_main_subject_verb_distractors(self, number: str) -> 'EDoc':
-		'''Change the number of all distractor nouns.'''
-		n = NUMBER_MAP[number]
-		if n == SG:
-			f = lambda t: t.singularize()
-		elif n == PL:
-			f = lambda t: t.pluralize()
+		'''
+		Change the number of all distractor nouns,
+		and of their determiners that agree with them.
+		Raises a ValueError if a determiner has no
+		form for the new number (like 'a' or 'many').
+		'''
+		f = RENUMBER_FUNS[NUMBER_MAP[number]]
 		
 		ds = self.main_subject_verb_distractors
-		for i, _ in enumerate(ds):
-			f(ds[i])
+		for d in ds:
+			f(d)
 		
 		dds = self.main_subject_verb_distractors_determiners
-		for i, _ in enumerate(dds):
-			f(dds[i])
+		for dd in dds:
+			dd.renumber_determiner(number)
 		
 		if ds:
 			return self.copy_with_replace(tokens=ds + dds)
@@ -2191,196 +2714,207 @@ class EDoc():
 		# of everything else
 		added = 0
 		
-		for v in vs:
-			# if the verb has its own subject, we
-			# need to invert them. if not, we don't
-			# need to do inversion, just reinflection
-			v_has_subject = True
-			
-			# the verb's subject attribute is recursive
-			# but for questions, we don't want that, since
-			# we need to know whether the verb
-			# has its own subject to properly reorder things
-			# so we have to check this manually here
-			# exclude things that only have attrs, because 
-			# those are "objects" of copular verbs (like become)
-			s = [t for t in v.children if t.dep_ in SUBJ_DEPS]
-			if all(t.dep_ == 'attr' for t in s):
-				s = []
-			
-			if len(s) == 1:
-				s = s[0]
-			
-			# if we have a chain of auxes, we need to step up through them
-			# and see if the final verb has a subject
-			next_v = v
-			if not s and v.is_aux:
-				while next_v.head.is_aux:
-					next_v = next_v.head
+		# the intermediate copies made in the loop are never part of
+		# the history of the question, so we skip recording it for them
+		with disable_history():
+			for v in vs:
+				# if the verb has its own subject, we
+				# need to invert them. if not, we don't
+				# need to do inversion, just reinflection
+				v_has_subject = True
 				
-				s = [t for t in next_v.head.children if t.dep_ in SUBJ_DEPS]
-			
-			if not (s and self._can_be_inverted_subject(s, next_v)):
-				v_has_subject = False
-				next_v = v
-				while not next_v.subject:
-					next_v = next_v.head
+				# the verb's subject attribute is recursive
+				# but for questions, we don't want that, since
+				# we need to know whether the verb
+				# has its own subject to properly reorder things
+				# so we have to check this manually here
+				# exclude things that only have attrs, because 
+				# those are "objects" of copular verbs (like become)
+				s = v._children_with_deps(SUBJ_DEP_IDS)
+				if all(t.dep_ == 'attr' for t in s):
+					s = []
 				
-				s = next_v.subject
-			
-			# save this so we can put the preceding token here
-			v_original_index = v.i
-			v_original_whitespace_ = v.whitespace_
-			
-			aux = self._get_aux(v)
-			aux.whitespace_ = ' '
-			
-			# if the verb has a subject,
-			# do aux inversion or do-support
-			if v_has_subject:
-				# inflect the aux
-				if aux.can_be_inflected:
-					number = v.get_morph('Number')
-					person = v.get_morph('Person')
-					
-					if person is not None:
-						person = int(person)
+				if len(s) == 1:
+					s = s[0]
+				
+				# if we have a chain of auxes, we need to step up through them
+				# and see if the final verb has a subject
+				next_v = v
+				if not s and v.is_aux:
+					while next_v.head.is_aux:
+						next_v = next_v.head
 					
-					if number is None or person is None:
-						s = v.subject
-						if isinstance(s,list):
-							number = self._get_list_noun_number(s) if number is None else number
-							person = 3 if person is None else person
-						else:
-							if any(self._get_conjuncts(s)):
-								s = [s]
-								s.extend(self._get_conjuncts(s[0]))
-								number = self._get_list_noun_number(s) if number is None else number 
-								person = 3 if person is None else person
-								s = s[0]
-							elif s.text in ALL_PARTITIVES:
-								number = self._get_partitive_noun_number(s) if number is None else number
-								person = 3 if person is None else person
-							else:
-								number = self._get_noun_number(s) if number is None else number
-								person = s.get_morph('Person')
-								person = int(person) if person else 3
-						
-					tense = v.get_morph('Tense')
-					aux.reinflect(number=number, person=person, tense=tense)
+					s = next_v.head._children_with_deps(SUBJ_DEP_IDS)
 				
-				# inversion means putting inserting the aux
-				# at the earliest position of the subject
-				aux.i = self._get_subject_initial_index(s)
+				if not (s and self._can_be_inverted_subject(s, next_v)):
+					v_has_subject = False
+					next_v = v
+					s = next_v.subject
+					while not s:
+						next_v = next_v.head
+						s = next_v.subject
 				
-				# if the verb is an aux already, we
-				# need to set the dependencies of the
-				# added aux accordingly
-				if v.is_aux and not v.lemma_ == 'get':
-					# if the verb is the head, then
-					# set the head of aux to itself and
-					# it is the root node
-					if v.head.i == v_original_index:
-						aux.head = aux
-						aux.dep_ = 'ROOT'
-					else:
-						# account for passive auxiliaries,
-						# which have existing dependencies
-						# try:
-						# 	aux.head = self[v.head.i+added+1]
-						# except IndexError:
-						# if the verb is near the end of the sentence
-						# we might be trying to index past the max len
-						# which raises IndexError. to get around this, 
-						# we'll set a special attr that the copy_with_* 
-						# functions will allow to override the actual 
-						# index of the head if it exists
-						aux.head_i = v.head.i+added+1	
-						aux.dep_ = v.dep_
-				else:
-					try:
-						aux.head = self[aux.head.i+added+1]
-					except IndexError:
-						# if the aux is near the end of the sentence
-						# we might be trying to index past the max len
-						# which raises IndexError. to get around this, 
-						# we'll set a special attr that the copy_with_* 
-						# functions will allow to override the actual 
-						# index of the head if it exists
-						aux.head_i = aux.head.i+added+1
+				# save this so we can put the preceding token here
+				v_original_index = v.i
+				v_original_whitespace_ = v.whitespace_
 				
-				# if we have an n't contraction, we need to get rid of the
-				# whitespace following the aux
+				# get any negations of the verb now, since we may need
+				# to move them with the aux. these only depend on the parse,
+				# so we only need to find them once
 				if v.is_negative:
-					negs = [t for t in v.children if t.dep_ == 'neg']
-					negs += [t for t in v.head.children if t.dep_ == 'neg']
-					if any(t.text == "n't" for t in negs):
-						aux.whitespace_ = ''
+					negs = v._children_with_deps(NEG_DEP_IDS)
+					negs += v.head._children_with_deps(NEG_DEP_IDS)
+				else:
+					negs = []
 				
-				# insert the auxiliary
-				question =  question._copy_with_add(token=aux, index=aux.i+added)
-				added 	 += 1
+				contracted_neg = next((t for t in negs if t.text == "n't"), None)
+				full_neg = next((t for t in negs if t.text == 'not'), None)
 				
-				# if we have an n't contraction, we need to move that with
-				# the inverted aux. also deal with "cannot"
-				if v.is_negative:
-					negs = [t for t in v.children if t.dep_ == 'neg']
-					negs += [t for t in v.head.children if t.dep_ == 'neg']
-					if any(t.text == "n't" for t in negs):
-						neg = [t for t in negs if t.text == "n't"][0]
+				aux = self._get_aux(v)
+				aux.whitespace_ = ' '
+				
+				# if the verb has a subject,
+				# do aux inversion or do-support
+				if v_has_subject:
+					# inflect the aux
+					if aux.can_be_inflected:
+						# the morphs are parsed once per token,
+						# so look them up in the dict directly
+						morph 	= v._morph_to_dict
+						number 	= morph.get('Number') or None
+						person 	= morph.get('Person') or None
+						tense 	= morph.get('Tense') or None
+						
+						if person is not None:
+							person = int(person)
+						
+						if number is None or person is None:
+							s = v.subject
+							if isinstance(s,list):
+								number = self._get_list_noun_number(s) if number is None else number
+								person = 3 if person is None else person
+							else:
+								conjuncts = self._get_conjuncts(s)
+								if any(conjuncts):
+									s = [s]
+									s.extend(conjuncts)
+									number = self._get_list_noun_number(s) if number is None else number 
+									person = 3 if person is None else person
+									s = s[0]
+								elif s.text in ALL_PARTITIVES:
+									number = self._get_partitive_noun_number(s) if number is None else number
+									person = 3 if person is None else person
+								else:
+									number = self._get_noun_number(s) if number is None else number
+									person = s.get_morph('Person')
+									person = int(person) if person else 3
+						
+						aux.reinflect(number=number, person=person, tense=tense)
+					
+					# inversion means putting inserting the aux
+					# at the earliest position of the subject
+					aux.i = self._get_subject_initial_index(s)
+					
+					# if the verb is an aux already, we
+					# need to set the dependencies of the
+					# added aux accordingly
+					if v.is_aux and not v.lemma_ == 'get':
+						# if the verb is the head, then
+						# set the head of aux to itself and
+						# it is the root node
+						if v.head.i == v_original_index:
+							aux.head = aux
+							aux.dep_ = 'ROOT'
+						else:
+							# account for passive auxiliaries,
+							# which have existing dependencies
+							# try:
+							# 	aux.head = self[v.head.i+added+1]
+							# except IndexError:
+							# if the verb is near the end of the sentence
+							# we might be trying to index past the max len
+							# which raises IndexError. to get around this, 
+							# we'll set a special attr that the copy_with_* 
+							# functions will allow to override the actual 
+							# index of the head if it exists
+							aux.head_i = v.head.i+added+1	
+							aux.dep_ = v.dep_
+					else:
+						try:
+							aux.head = self[aux.head.i+added+1]
+						except IndexError:
+							# if the aux is near the end of the sentence
+							# we might be trying to index past the max len
+							# which raises IndexError. to get around this, 
+							# we'll set a special attr that the copy_with_* 
+							# functions will allow to override the actual 
+							# index of the head if it exists
+							aux.head_i = aux.head.i+added+1
+					
+					# if we have an n't contraction, we need to get rid of the
+					# whitespace following the aux
+					if contracted_neg is not None:
+						aux.whitespace_ = ''
+					
+					# insert the auxiliary
+					question =  question._copy_with_add(token=aux, index=aux.i+added)
+					added 	 += 1
+					
+					# if we have an n't contraction, we need to move that with
+					# the inverted aux. also deal with "cannot"
+					if contracted_neg is not None:
+						neg = copy(contracted_neg)
 						neg.head_i = v.head.i+added+1
 						question = question._copy_with_add(token=neg, index=aux.i+added)
 						added += 1
-			
-			# if the verb was already an aux, we need to remove
-			# the aux in the original position
-			if v.is_aux and not v.lemma_ == 'get':
-				question =  question._copy_with_remove(indices=v_original_index+added, move_deps_to=aux.i)
-				added 	 -= 1
-			else:
-				# if the verb is not an aux, we need
-				# to reinflect it to the infinitive
-				# form for do-support
-				v.reinflect(tense=INFINITIVE)
-				v.set_morph(Number=None, Tense=None, VerbForm='Inf')
-				# try: 
-				# 	v.head = self[v.head.i+added]
-				# except IndexError:
-				v.head_i = v.head.i+added
 				
-				question = question.copy_with_replace(tokens=v, indices=v.i+added)
-			
-			# if we moved n't, we also need to delete that
-			if v.is_negative:
-				negs = [t for t in v.children if t.dep_ == 'neg']
-				negs += [t for t in v.head.children if t.dep_ == 'neg']
-				if any(t.text == "n't" for t in negs):
-					neg = [t for t in negs if t.text == "n't"][0]
-					neg_index = neg.i
-					question = question._copy_with_remove(indices=neg.i+added, move_deps_to=aux.i+added)
-					added -= 1
-				elif (
-					any(t.text == 'not' for t in negs) and
-					v.is_aux and 
-					v.text == 'can' and
-					v_original_whitespace_ == ''
-				):
-					neg = [t for t in negs if t.text == 'not'][0]
-					prev_i = v_original_index - 1
-					prev_token = self[prev_i]
-					prev_token.whitespace_ = ' '
-					
-					# we need to replace the token before the 
-					# new position of the negation,
-					# not at the original index of that token
-					replace_index = neg.i-1+added
-					
-					# if we're not replacing at the beginning of the sentence,
-					# decapitalize the token if it should be decapitalized
-					if not replace_index == 0 and prev_token.can_be_decapitalized:
-						prev_token.text = prev_token.text[0].lower() + prev_token.text[1:]
+				# if the verb was already an aux, we need to remove
+				# the aux in the original position
+				if v.is_aux and not v.lemma_ == 'get':
+					question =  question._copy_with_remove(indices=v_original_index+added, move_deps_to=aux.i)
+					added 	 -= 1
+				else:
+					# if the verb is not an aux, we need
+					# to reinflect it to the infinitive
+					# form for do-support
+					v.reinflect(tense=INFINITIVE)
+					v.set_morph(Number=None, Tense=None, VerbForm='Inf')
+					# try: 
+					# 	v.head = self[v.head.i+added]
+					# except IndexError:
+					v.head_i = v.head.i+added
 					
-					question = question.copy_with_replace(tokens=prev_token, indices=neg.i-1+added)
+					question = question.copy_with_replace(tokens=v, indices=v.i+added)
+				
+				# if we moved n't, we also need to delete that
+				if negs:
+					if contracted_neg is not None:
+						neg = contracted_neg
+						neg_index = neg.i
+						question = question._copy_with_remove(indices=neg.i+added, move_deps_to=aux.i+added)
+						added -= 1
+					elif (
+						full_neg is not None and
+						v.is_aux and 
+						v.text == 'can' and
+						v_original_whitespace_ == ''
+					):
+						neg = full_neg
+						prev_i = v_original_index - 1
+						prev_token = self[prev_i]
+						prev_token.whitespace_ = ' '
+						
+						# we need to replace the token before the 
+						# new position of the negation,
+						# not at the original index of that token
+						replace_index = neg.i-1+added
+						
+						# if we're not replacing at the beginning of the sentence,
+						# decapitalize the token if it should be decapitalized
+						if not replace_index == 0 and prev_token.can_be_decapitalized:
+							prev_token.text = prev_token.text[0].lower() + prev_token.text[1:]
+						
+						question = question.copy_with_replace(tokens=prev_token, indices=neg.i-1+added)
 		
 		q_mark, q_mark_i = self._get_question_punctuation(question)
 		
@@ -2402,7 +2936,7 @@ class EDoc():
 	def _get_question_punctuation(self, question: 'EDoc') -> Tuple:
 		# replace the final punct with a question mark
 		final = question[-1]
-		if not final.text in ['!', '.'] or final.dep_ != 'punct':
+		if not final.text in DECLARATIVE_FINAL_PUNCT or final.dep_ != 'punct':
 			raise ParseError(
 				f'The sentence "{self}" does not end with '
 				'an exclamation point or period! '
@@ -2416,18 +2950,16 @@ class EDoc():
 	
 	def _can_be_inverted_subject(self, s: Union[EToken,List[EToken]], v: EToken) -> bool:
 		'''Can the passed subject be inverted with an aux?'''
-		if not isinstance(s,list):
-			s = [s]
-		else:
-			s = [s[0]]
+		# only the first subject matters
+		s = listify(s)[:1]
 		
 		# a subject cannot be inverted with an aux
 		# if it is clausal and the verb is not a gerund
 		# (i.e., if it is headed by "that" or "to")
 		if any(
-			t.dep_ in ['csubj', 'csubjpass'] 
+			t.dep_ in CLAUSAL_SUBJ_DEPS 
 			for t in s 
-			if 	t.tag_ not in ['VBG', 'VBN', 'VB', 'VBZ'] or 
+			if 	t.tag_ not in NON_COMPLEMENTIZER_CLAUSE_TAGS or 
 				t.get_morph('VerbForm') == 'Inf'
 		):
 			# clausal_subject_text = ' '.join(
@@ -2459,32 +2991,35 @@ class EDoc():
 		if v.is_aux and not v.lemma_ == 'get':
 			return v
 		else:
-			return EToken.from_definition(**{
-				**Q_DO,
-				'whitespace_': ' ',
-				'head': v,
-			})
+			# copy the formatted do rather than making a new one
+			aux = copy(Q_DO_TOKEN)
+			aux.head = v
+			return aux
 	
 	@staticmethod
 	def _get_subject_initial_index(s: Union[EToken,List[EToken]]) -> int:
 		'''Get the earliest index in the phrase of the subject.'''
-		if isinstance(s,list):
-			earliest_subject_index = min([t.i for t in s])
-		else:
-			earliest_subject_index = s.i
-			s = [s]
-		
-		# recursive go through the children of the subject
-		# until no more are found, and get the lowest index
-		children = [t for n in s for t in n.children]
-		all_children = children
-		while children:
-			children = [t for child in children for t in child.children]
-			all_children = children + all_children
-		
-		children = all_children
+		s = listify(s)
+		
+		# go through the subject and all its descendants,
+		# keeping track of the lowest index. we walk the
+		# underlying spaCy tokens where we can, so that we
+		# don't wrap every descendant in an EToken. we can't
+		# use Token.left_edge, since it isn't always right
+		# for non-projective parses
+		earliest_subject_index = min(t.i for t in s)
+		stack = []
+		for n in s:
+			if isinstance(getattr(n, '_token', None), Token):
+				stack.extend(n._token.children)
+			else:
+				stack.extend(n.children)
 		
-		if children:
-			earliest_subject_index = min([earliest_subject_index, *[t.i for t in children]])
+		while stack:
+			t = stack.pop()
+			if t.i < earliest_subject_index:
+				earliest_subject_index = t.i
+			
+			stack.extend(t.children)
 		
 		return earliest_subject_index
\ No newline at end of file
@@ -0,0 +1,59 @@
+'''
+Make a table of noun inflections using pattern.en,
+so that renumbering nouns doesn't need to call it.
+The table maps each form of a noun to its singular
+and plural, in the location spacyutils loads it from.
+'''
+import os
+import json
+import argparse
+
+from typing import List, Dict
+
+from pattern.en import lexeme, singularize, pluralize
+from pattern.en import SG, PL
+
+NOUN_INFLECTIONS_FILE: str = os.path.join(os.path.dirname(__file__), 'data', 'noun_inflections.json')
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+	'nouns',
+	help='A file with the nouns to add to the table, one per line.'
+)
+
+parser.add_argument(
+	'-o', '--output', default=NOUN_INFLECTIONS_FILE,
+	help=f'Where to save the table. Default ({NOUN_INFLECTIONS_FILE}) is where spacyutils looks for it.'
+)
+
+# workaround for pattern.en bug in python > 3.6
+try:
+	_ = lexeme('bad pattern.en >:(')
+except RuntimeError:
+	pass
+
+def make_noun_inflections(nouns: List[str]) -> Dict[str,Dict[str,str]]:
+	'''
+	Singularize and pluralize each noun, along with
+	its singular and plural forms, since EToken.renumber
+	can start from either. Nouns are lowercased,
+	since that is how EToken looks them up.
+	'''
+	table = {}
+	for noun in nouns:
+		noun = noun.lower()
+		for form in [noun, singularize(noun), pluralize(noun)]:
+			if form and form not in table:
+				table[form] = {SG: singularize(form), PL: pluralize(form)}
+	
+	return table
+
+if __name__ == '__main__':
+	args = parser.parse_args()
+	with open(args.nouns, 'rt', encoding='utf-8') as in_file:
+		nouns = [line.strip() for line in in_file if line.strip()]
+	
+	table = make_noun_inflections(nouns)
+	
+	with open(args.output, 'wt', encoding='utf-8') as out_file:
+		json.dump(table, out_file, indent='\t', ensure_ascii=False)
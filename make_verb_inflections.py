@@ -0,0 +1,62 @@
+'''
+Make a table of verb inflections using pattern.en,
+so that reinflecting verbs doesn't need to call it.
+The table is saved in the format of CONJUGATE_MAP,
+in the location spacyutils loads it from.
+'''
+import os
+import json
+import argparse
+
+from typing import List, Dict
+
+from pattern.en import lexeme, conjugate
+from pattern.en import SG, PL
+from pattern.en import PAST, PRESENT, INFINITIVE
+
+VERB_INFLECTIONS_FILE: str = os.path.join(os.path.dirname(__file__), 'data', 'verb_inflections.json')
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+	'verbs',
+	help='A file with the verbs to add to the table, one per line.'
+)
+
+parser.add_argument(
+	'-o', '--output', default=VERB_INFLECTIONS_FILE,
+	help=f'Where to save the table. Default ({VERB_INFLECTIONS_FILE}) is where spacyutils looks for it.'
+)
+
+# workaround for pattern.en bug in python > 3.6
+try:
+	_ = lexeme('bad pattern.en >:(')
+except RuntimeError:
+	pass
+
+def make_verb_inflections(verbs: List[str]) -> Dict[str,Dict[str,Dict[str,str]]]:
+	'''
+	Conjugate every form of each verb for every
+	number and tense EToken.reinflect uses.
+	Conjugations without a number are under 'any'.
+	'''
+	table = {}
+	for verb in verbs:
+		for form in lexeme(verb):
+			for number in [SG, PL, None]:
+				for tense in [PRESENT, PAST, INFINITIVE]:
+					kwargs = dict(tense=tense) if number is None else dict(number=number, tense=tense)
+					text = conjugate(form, **kwargs)
+					if text:
+						table.setdefault(form, {}).setdefault(number or 'any', {})[tense] = text
+	
+	return table
+
+if __name__ == '__main__':
+	args = parser.parse_args()
+	with open(args.verbs, 'rt', encoding='utf-8') as in_file:
+		verbs = [line.strip() for line in in_file if line.strip()]
+	
+	table = make_verb_inflections(verbs)
+	
+	with open(args.output, 'wt', encoding='utf-8') as out_file:
+		json.dump(table, out_file, indent='\t', ensure_ascii=False)